@@ -58,10 +58,7 @@ analytics_data = {
 def ensure_api_keys():
     """Ensure API keys are loaded from environment variables."""
     # Force reload API keys from environment
-    automation.api_keys["openai"] = os.getenv("OPENAI_API_KEY")
-    automation.api_keys["elevenlabs"] = os.getenv("ELEVENLABS_API_KEY")
-    automation.api_keys["pexels"] = os.getenv("PEXELS_API_KEY")
-    automation.api_keys["youtube"] = os.getenv("YOUTUBE_API_KEY")
+    automation.load_api_keys()
     
     # Log what we found
     loaded_keys = [key for key, value in automation.api_keys.items() if value]
@@ -1956,6 +1953,7 @@ def run_full_automation_with_status_updates(job_id, niche, voice_id=None):
         # Select the best idea (not just random)
         idea = automation._select_best_idea(ideas, niche)
         print(f"Selected Shorts idea: {idea['title']}")
+        automation._remember_idea(idea, niche)
         
         # Update job status with selected idea
         current_jobs[job_id]['message'] = f'Writing script for: "{idea["title"]}"...'
@@ -19,26 +19,466 @@ Features:
 """
 
 import os
+import copy
 import json
+import base64
+import hashlib
+import io
 import time
 import random
 import requests
 import subprocess
 import re
-import sys
 import shutil
-from datetime import datetime, timedelta
+import sqlite3
+import tempfile
+import threading
+import types
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import islice
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import orjson  # Optional: faster analytics serialization
+except ImportError:
+    orjson = None
+
+# Configuration written to config.json when none exists yet (deep-copied on use)
+_DEFAULT_CONFIG = types.MappingProxyType({
+    "content_types": ["how_to", "top_10", "explainer"],
+    "video_length": "short",  # short for Shorts
+    "target_audience": "general",
+    "style": "engaging",  # More engaging style for Shorts
+    "upload_schedule": {
+        "frequency": "daily",  # daily, weekly, biweekly
+        "time": "15:00"
+    },
+    "directories": {
+        "scripts": "scripts",
+        "audio": "audio",
+        "video": "video",
+        "thumbnails": "thumbnails",
+        "output": "output",
+        "analytics": "analytics",
+        "cache": "cache"
+    },
+    "api_settings": {
+        "retry_attempts": 3,
+        "use_api_quota": 0.8,  # Use API for 80% of content, templates for 20%
+        "preferred_model": "gpt-3.5-turbo",  # Cheaper model as default
+        "tts_workers": 4  # Concurrent ElevenLabs requests per narration
+    },
+    "debug": False,  # Print full API responses instead of short excerpts
+    "shorts_mode": True,  # Always True for Shorts
+    "shorts_settings": {
+        "enabled": True,
+        "max_duration": 60,  # Maximum 60 seconds for Shorts
+        "vertical_format": True,  # Vertical format for Shorts
+        "fast_paced": True  # Fast-paced editing for Shorts
+    }
+})
+
+# Shorts settings filled in when a loaded config does not define them
+_SHORTS_DEFAULTS = types.MappingProxyType({
+    "enabled": True,
+    "max_duration": 60,
+    "vertical_format": True,
+    "fast_paced": True
+})
+
+# Words that should not be capitalized in titles (unless first or last word)
+_LOWERCASE_WORDS = frozenset({"a", "an", "the", "and", "but", "or", "for", "nor", "on", "at", "to", "from", "by", "in", "of"})
+
+# Keywords that already mark an idea as Shorts content
+_SHORTS_KEYWORDS = frozenset({"shorts", "shortsvideo", "shortsyoutube", "tiktok", "reels"})
+
+# Fields every generated idea must have
+_REQUIRED_IDEA_KEYS = ("title", "description", "key_points", "keywords")
+
+# Substrings that count as a hook when _optimize_for_shorts decides whether to add one
+_SHORTS_HOOK_MARKERS = frozenset({"?", "how", "why", "this", "secret", "try"})
+
+# Generic Shorts keywords left out of the topic hashtags in upload descriptions
+_GENERIC_SHORTS_TAGS = frozenset({"shorts", "youtubeshorts", "shortvideo"})
+
+# Substrings _select_best_idea rewards in titles and keywords
+_TITLE_HOOKS = frozenset({"?", "how", "why", "this", "secret", "hack", "try", "!"})
+_POWER_WORDS = frozenset({"ultimate", "secret", "shocking", "proven", "powerful",
+                          "revealed", "strategy", "fast", "quick"})
+_SCORING_SHORTS_KEYWORDS = frozenset({"shorts", "shortsvideo", "tiktok", "trending", "viral"})
+
+# Shorts video spec: clips are scaled and padded to a 720x1280 (9:16) frame at 30 fps
+_SHORTS_WIDTH, _SHORTS_HEIGHT, _SHORTS_FPS = 720, 1280, 30
+_VERTICAL_FILTER = (
+    f"scale={_SHORTS_WIDTH}:{_SHORTS_HEIGHT}:force_original_aspect_ratio=decrease,"
+    f"pad={_SHORTS_WIDTH}:{_SHORTS_HEIGHT}:(ow-iw)/2:(oh-ih)/2"
+)
+# Full per-clip normalization, so clips of any size, frame rate or pixel format can be joined
+_STANDARD_FRAME_FILTER = f"{_VERTICAL_FILTER},setsar=1,fps={_SHORTS_FPS},format=yuv420p"
+_SHORTS_TIMESCALE = "15360"
+
+# ffprobe stream fields that must be identical across clips before they can be joined by stream copy
+_STREAM_COPY_FIELDS = ("profile", "level", "codec_tag", "time_base", "extradata_hash")
+
+# Stock footage smaller than this is skipped before downloading when the search reports it
+_MIN_CLIP_HEIGHT = 720
+_MIN_CLIP_BYTES = 50_000
+
+# RAM-backed directory for FFmpeg intermediates, used only when it has this much free space
+_RAM_SCRATCH_DIR = "/dev/shm"
+_RAM_SCRATCH_MIN_FREE = 1024 * 1024 * 1024
+
+# Most ffmpeg/ffprobe processes allowed to run at the same time
+_FFMPEG_SLOTS = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+# MP3 frame header tables, keyed by (is MPEG-1, layer bits) and by version bits
+_MP3_BITRATES = {
+    (True, 3): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 1): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 3): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 1): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+# Hardware H.264 encoders tried before libx264, with settings close to -crf 23
+_HW_H264_ENCODERS = (
+    ("h264_nvenc", ("-rc", "vbr", "-cq", "23")),
+    ("h264_videotoolbox", ("-q:v", "60")),
+)
+_X264_ARGS = ("-c:v", "libx264", "-preset", "medium", "-crf", "23")
+
+# Longest API response body printed in error messages when debug is off
+_LOGGED_BODY_CHARS = 500
+
+# Fonts tried, in order, for placeholder thumbnail text
+_FONT_CANDIDATES = ('arial.ttf', 'Arial.ttf', 'Verdana.ttf', 'times.ttf', 'Times.ttf', 'Courier.ttf')
+
+# Characters that can't appear in file or directory names, mapped to '-'
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys(':/\\?*"<>|\'', '-'))
+
+# How long cached OpenAI descriptions and Pexels search results stay valid, in seconds
+_API_CACHE_TTL = 7 * 24 * 3600
+
+# Narrator text in generated scripts, and non-blank lines for the untagged fallback
+# (any line ending; text after the first tag on a line, like split('[NARRATOR]', 1))
+_NARRATOR_RE = re.compile(r'\[NARRATOR\]([^\r\n]*)')
+_NON_BLANK_LINE_RE = re.compile(r'\S[^\r\n]*')
+
+# Sentence boundaries for narration chunking, and JSON fragments in model responses
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_JSON_ARRAY_START_RE = re.compile(r'\[\s*\{')
+_JSON_OBJECT_START_RE = re.compile(r'\{')
+
+# Words kept when normalizing idea titles for the idea history
+_WORD_RE = re.compile(r'\w+')
+_JSON_DECODER = json.JSONDecoder()
+
+# Niche buckets used to tailor prompts and title templates, checked in order
+_NICHE_BUCKETS = {
+    "finance": frozenset({"finance", "money", "invest", "trading", "fintech", "crypto", "wealth"}),
+    "tech": frozenset({"tech", "technology", "software", "digital", "ai", "programming"}),
+    "health": frozenset({"health", "fitness", "exercise", "workout", "diet"}),
+    "food": frozenset({"food", "cooking", "recipe", "baking", "kitchen"}),
+}
+
+@lru_cache(maxsize=128)
+def _classify_niche(niche):
+    """Return the bucket name for a niche (e.g. "finance"), or None if no bucket matches."""
+    niche_lower = niche.lower()
+    for bucket, terms in _NICHE_BUCKETS.items():
+        if any(term in niche_lower for term in terms):
+            return bucket
+    return None
+
+@lru_cache(maxsize=1)
+def _month_year(hour_bucket):
+    """Return the current month name and year; pass an hour bucket so it refreshes hourly."""
+    now = datetime.now()
+    return now.strftime("%B"), now.year
+
+@lru_cache(maxsize=1024)
+def _title_words(title):
+    """Return the lowercased word set of a title, cached across duplicate checks."""
+    return frozenset(title.lower().split())
+
+def _normalize_title(title):
+    """Return a title lowercased with punctuation dropped and whitespace collapsed, for exact duplicate checks."""
+    return " ".join(_WORD_RE.findall(str(title).lower()))
+
+def _json_dumps(obj):
+    """Serialize obj to compact JSON bytes, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _iter_json_values(text, start_re):
+    """Yield each JSON value that can be decoded where start_re matches, scanning left to right."""
+    pos = 0
+    while True:
+        match = start_re.search(text, pos)
+        if match is None:
+            return
+        try:
+            value, pos = _JSON_DECODER.raw_decode(text, match.start())
+        except json.JSONDecodeError:
+            pos = match.start() + 1
+            continue
+        yield value
+
+def _hydrate_idea(idea):
+    """Cache an idea's lowercased title and keywords under underscore-prefixed keys."""
+    title_lc = idea["title"].lower()
+    keywords = idea.get("keywords")
+    idea["_title_lc"] = title_lc
+    idea["_kw_set"] = frozenset(str(kw).lower() for kw in keywords) if isinstance(keywords, list) else frozenset()
+    return idea
+
+def _run_ffmpeg(args, **kwargs):
+    """
+    Run an ffmpeg or ffprobe command, limiting how many run at once.
+    
+    Adds -nostdin, -hide_banner and -loglevel error for ffmpeg. Keyword arguments go
+    to subprocess.run. Unless the caller asks for output, ffmpeg's stdout is discarded
+    and only its (error-level) stderr is kept; ffprobe's output is captured.
+    """
+    args = list(args)
+    if args[0] == "ffmpeg":
+        args[1:1] = ["-nostdin", "-hide_banner", "-loglevel", "error"]
+        if "capture_output" not in kwargs:
+            kwargs.setdefault("stdout", subprocess.DEVNULL)
+            kwargs.setdefault("stderr", subprocess.PIPE)
+    else:
+        args[1:1] = ["-hide_banner"]
+        kwargs.setdefault("capture_output", True)
+    with _FFMPEG_SLOTS:
+        return subprocess.run(args, **kwargs)
+
+@lru_cache(maxsize=1)
+def _h264_encoder_args():
+    """Return the FFmpeg video encoder arguments, preferring a working hardware H.264 encoder."""
+    try:
+        listing = _run_ffmpeg(
+            ["ffmpeg", "-encoders"], capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return _X264_ARGS
+    
+    for encoder, quality_args in _HW_H264_ENCODERS:
+        if encoder not in listing:
+            continue
+        # FFmpeg lists encoders even without the hardware to run them, so try a tiny encode
+        args = ("-c:v", encoder) + quality_args
+        try:
+            _run_ffmpeg(
+                ["ffmpeg", "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                 *args, "-pix_fmt", "yuv420p", "-f", "null", "-"],
+                check=True, timeout=15
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        print(f"Using hardware video encoder: {encoder}")
+        return args
+    return _X264_ARGS
+
+@lru_cache(maxsize=8)
+def _load_font(size):
+    """Return the first available font from _FONT_CANDIDATES at size, or PIL's default font."""
+    from PIL import ImageFont
+    
+    for font_name in _FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(font_name, size)
+        except (OSError, ImportError):
+            continue
+    try:
+        return ImageFont.load_default()
+    except Exception:
+        return None
+
+def _mp3_duration(path):
+    """
+    Return the duration of an MP3 file in seconds by walking its frame headers, or None.
+    
+    Every frame is counted, so files made by joining several MP3s (like the narration
+    chunks) are measured correctly; ID3 tags and stray bytes between frames are skipped.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    
+    pos, end = 0, len(data)
+    samples = 0.0
+    frame_bytes = 0
+    while pos + 4 <= end:
+        if data[pos:pos + 3] == b"ID3" and pos + 10 <= end:
+            # ID3v2 tag: the size is a 28-bit syncsafe integer after a 10-byte header
+            size = (data[pos + 6] << 21) | (data[pos + 7] << 14) | (data[pos + 8] << 7) | data[pos + 9]
+            pos += 10 + size
+            continue
+        
+        b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+        version, layer = (b1 >> 3) & 0x3, (b1 >> 1) & 0x3
+        bitrate_index, rate_index = b2 >> 4, (b2 >> 2) & 0x3
+        if (data[pos] != 0xFF or (b1 & 0xE0) != 0xE0 or version == 1 or layer == 0
+                or bitrate_index in (0, 15) or rate_index == 3):
+            pos += 1  # Not a frame header; resynchronize
+            continue
+        
+        mpeg1 = version == 3
+        bitrate = _MP3_BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+        frame_samples = 384 if layer == 3 else (1152 if mpeg1 or layer == 2 else 576)
+        padding = (b2 >> 1) & 0x1
+        if layer == 3:
+            frame_length = (12 * bitrate // sample_rate + padding) * 4
+        else:
+            frame_length = frame_samples // 8 * bitrate // sample_rate + padding
+        
+        # A Xing/Info frame only carries encoder metadata, not audio
+        header_window = data[pos + 4:pos + 40]
+        if b"Xing" not in header_window and b"Info" not in header_window:
+            samples += frame_samples / sample_rate
+        frame_bytes += frame_length
+        pos += frame_length
+    
+    # Mostly unrecognized bytes means this isn't really an MP3, whatever the extension says
+    if frame_bytes < end // 2:
+        return None
+    return samples or None
+
+def _read_box_header(f):
+    """Read an MP4 box header from f, returning (type, payload size) or None at end of file."""
+    header = f.read(8)
+    if len(header) < 8:
+        return None
+    size, box_type = int.from_bytes(header[:4], "big"), header[4:]
+    if size == 1:
+        size = int.from_bytes(f.read(8), "big") - 16  # 64-bit size follows the type
+    elif size == 0:
+        size = os.fstat(f.fileno()).st_size - f.tell()  # Box runs to the end of the file
+    else:
+        size -= 8
+    return box_type, size
+
+def _mp4_duration(path):
+    """
+    Return the duration of an MP4/MOV file in seconds from its movie header (mvhd), or None.
+    
+    Only the box headers are read and media data is skipped over, so this costs a few
+    small reads instead of starting ffprobe.
+    """
+    try:
+        with open(path, 'rb') as f:
+            moov_end = None
+            while True:
+                box = _read_box_header(f)
+                if box is None or box[1] < 0:
+                    return None
+                box_type, size = box
+                if box_type == b"moov":
+                    moov_end = f.tell() + size
+                elif box_type == b"mvhd" and moov_end is not None:
+                    payload = f.read(min(size, 32))
+                    if payload[:1] == b"\x01":  # Version 1: 64-bit times and duration
+                        timescale = int.from_bytes(payload[20:24], "big")
+                        duration = int.from_bytes(payload[24:32], "big")
+                    else:
+                        timescale = int.from_bytes(payload[12:16], "big")
+                        duration = int.from_bytes(payload[16:20], "big")
+                    return duration / timescale if timescale and duration else None
+                elif moov_end is not None and f.tell() + size > moov_end:
+                    return None
+                else:
+                    f.seek(size, os.SEEK_CUR)
+    except OSError:
+        return None
+
+def _scratch_parent():
+    """Return the RAM-backed directory for intermediates if it exists and has room, else None (the system temp dir)."""
+    try:
+        if shutil.disk_usage(_RAM_SCRATCH_DIR).free >= _RAM_SCRATCH_MIN_FREE:
+            return _RAM_SCRATCH_DIR
+    except OSError:
+        pass
+    return None
+
+def _write_concat_list(paths, list_path):
+    """Write an FFmpeg concat demuxer list of paths to list_path and return list_path."""
+    with open(list_path, 'w') as f:
+        f.write("".join(f"file '{os.path.abspath(path)}'\n" for path in paths))
+    return list_path
+
+def _describe_file(path, indent):
+    """Describe a file's size and modification time for the diagnostic report, with one stat call."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"{indent}ERROR: File does not exist\n"
+    return (f"{indent}Size: {stat.st_size} bytes\n"
+            f"{indent}Last modified: {datetime.fromtimestamp(stat.st_mtime)}\n")
+
+def _has_shorts_size(stream):
+    """Check whether a probed video stream is already 720x1280."""
+    return bool(stream) and stream.get("width") == _SHORTS_WIDTH and stream.get("height") == _SHORTS_HEIGHT
+
+def _is_shorts_stream(stream):
+    """Check whether a probed video stream is 720x1280 30 fps yuv420p H.264 and can be stream-copied."""
+    return _has_shorts_size(stream) and (
+        stream.get("codec_name") == "h264"
+        and stream.get("pix_fmt") == "yuv420p"
+        and stream.get("r_frame_rate") == f"{_SHORTS_FPS}/1"
+    )
+
+def _can_stream_concat(streams):
+    """Check whether probed video streams all match the Shorts spec and share the codec parameters a stream-copy concat needs."""
+    if not streams or not all(_is_shorts_stream(stream) for stream in streams):
+        return False
+    first = [streams[0].get(field) for field in _STREAM_COPY_FIELDS]
+    return all([stream.get(field) for field in _STREAM_COPY_FIELDS] == first for stream in streams[1:])
+
+def _is_usable_clip(clip):
+    """Check stock footage search metadata against the minimum clip height and size (bare URLs pass)."""
+    if isinstance(clip, str):
+        return True
+    height, file_size = clip.get("height"), clip.get("file_size")
+    return (height is None or height >= _MIN_CLIP_HEIGHT) and (file_size is None or file_size >= _MIN_CLIP_BYTES)
+
+class _RandomPick(dict):
+    """Template values that pick a random element the first time a placeholder is looked up."""
+    
+    __slots__ = ("rng", "elements")
+    
+    def __init__(self, rng, elements, **fixed):
+        super().__init__(**fixed)
+        self.rng = rng
+        self.elements = elements
+    
+    def __missing__(self, key):
+        value = self[key] = self.rng.choice(self.elements[key])
+        return value
 
 class YouTubeShortsAutomationSystem:
     def __init__(self, config_path="config.json"):
         """Initialize the YouTube Shorts automation system with configuration."""
         self.load_config(config_path)
         self.setup_directories()
-        self.load_api_keys()
+        self._rng = random.Random()
+        self.http = self._create_http_session()
+        self._ideas_db = None
+        self._ideas_db_lock = threading.Lock()
+        self._api_cache_db = None
+        self._api_cache_lock = threading.Lock()
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._probe_cache = {}
         
     def load_config(self, config_path):
         """Load configuration from JSON file."""
@@ -52,12 +492,7 @@ class YouTubeShortsAutomationSystem:
             
             # If shorts_settings doesn't exist, create it with default values
             if "shorts_settings" not in self.config:
-                self.config["shorts_settings"] = {
-                    "enabled": True,
-                    "max_duration": 60,
-                    "vertical_format": True,
-                    "fast_paced": True
-                }
+                self.config["shorts_settings"] = dict(_SHORTS_DEFAULTS)
             else:
                 # Make sure enabled is True
                 self.config["shorts_settings"]["enabled"] = True
@@ -67,47 +502,88 @@ class YouTubeShortsAutomationSystem:
             
         except FileNotFoundError:
             print(f"Config file not found at {config_path}. Creating default config.")
-            self.config = {
-                "content_types": ["how_to", "top_10", "explainer"],
-                "video_length": "short",  # short for Shorts
-                "target_audience": "general",
-                "style": "engaging",  # More engaging style for Shorts
-                "upload_schedule": {
-                    "frequency": "daily",  # daily, weekly, biweekly
-                    "time": "15:00"
-                },
-                "directories": {
-                    "scripts": "scripts",
-                    "audio": "audio",
-                    "video": "video",
-                    "thumbnails": "thumbnails",
-                    "output": "output",
-                    "analytics": "analytics"
-                },
-                "api_settings": {
-                    "retry_attempts": 3,
-                    "use_api_quota": 0.8,  # Use API for 80% of content, templates for 20%
-                    "preferred_model": "gpt-3.5-turbo"  # Cheaper model as default
-                },
-                "shorts_mode": True,  # Always True for Shorts
-                "shorts_settings": {
-                    "enabled": True,
-                    "max_duration": 60,  # Maximum 60 seconds for Shorts
-                    "vertical_format": True,  # Vertical format for Shorts
-                    "fast_paced": True  # Fast-paced editing for Shorts
-                }
-            }
+            self.config = copy.deepcopy(dict(_DEFAULT_CONFIG))
             with open(config_path, 'w') as f:
                 json.dump(self.config, f, indent=4)
     
     def setup_directories(self):
         """Create necessary directories if they don't exist."""
+        # One directory listing instead of a makedirs call per configured directory
+        with os.scandir(".") as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+        
         for dir_name in self.config["directories"].values():
-            os.makedirs(dir_name, exist_ok=True)
+            # Nested or absolute paths aren't covered by the listing above
+            if os.sep in dir_name or (os.altsep and os.altsep in dir_name) or dir_name not in existing:
+                os.makedirs(dir_name, exist_ok=True)
         print("Directories setup complete.")
     
+    def _openai_post(self, endpoint, payload, timeout):
+        """POST a JSON payload to an OpenAI API endpoint over the shared session."""
+        return self.http.post(
+            f"https://api.openai.com/v1/{endpoint}",
+            headers={
+                "Authorization": f"Bearer {self.api_keys['openai']}",
+                "Content-Type": "application/json"
+            },
+            json=payload,
+            timeout=timeout
+        )
+    
+    def _openai_chat(self, model, prompt, temperature=0.7, timeout=60):
+        """Send a single-message chat completion request and return the raw response."""
+        return self._openai_post("chat/completions", {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature
+        }, timeout)
+    
+    def _openai_image(self, model, prompt, size="1024x1024", timeout=60):
+        """Request one generated image, returned inline as base64 (b64_json), and return the raw response."""
+        return self._openai_post("images/generations", {
+            "prompt": prompt,
+            "n": 1,
+            "size": size,
+            "model": model,
+            "response_format": "b64_json"
+        }, timeout)
+    
+    def _loggable_body(self, text):
+        """Return an API response body for printing, shortened unless debug is enabled."""
+        if self.config.get("debug") or len(text) <= _LOGGED_BODY_CHARS:
+            return text
+        return f"{text[:_LOGGED_BODY_CHARS]}... ({len(text)} chars)"
+    
+    def _create_http_session(self):
+        """Create the shared HTTP session so API calls and downloads reuse pooled connections."""
+        # Retry connection errors and rate-limit/server errors with exponential backoff,
+        # waiting as long as a Retry-After header asks; POSTs are retried too since the
+        # OpenAI and ElevenLabs calls are all POSTs
+        retries = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False  # Hand the last error response back to the caller
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    @cached_property
+    def api_keys(self):
+        """API keys, loaded from the environment on first access."""
+        return self.load_api_keys()
+    
     def load_api_keys(self):
-        """Load API keys from environment variables."""
+        """(Re)load API keys from the .env file and environment variables."""
+        # Load environment variables from .env file
+        load_dotenv()
+        
         self.api_keys = {
             "openai": os.getenv("OPENAI_API_KEY"),
             "elevenlabs": os.getenv("ELEVENLABS_API_KEY"),
@@ -119,6 +595,8 @@ class YouTubeShortsAutomationSystem:
         missing_keys = [key for key, value in self.api_keys.items() if not value]
         if missing_keys:
             print(f"Warning: Missing API keys for: {', '.join(missing_keys)}")
+        
+        return self.api_keys
     
     # ======== DYNAMIC CONTENT GENERATION SYSTEM ========
     
@@ -156,85 +634,28 @@ class YouTubeShortsAutomationSystem:
         
         # PART 1: API GENERATION WITH SMART FALLBACK
         if use_api and self.api_keys["openai"]:
-            # Try multiple models in order of cost-effectiveness
+            # Query all models concurrently and keep whatever arrives first
             models_to_try = ["gpt-3.5-turbo", "gpt-4", "gpt-4o"]
-            
-            for model in models_to_try:
-                # Skip if we already have enough ideas
+            executor = ThreadPoolExecutor(max_workers=len(models_to_try))
+            futures = [executor.submit(self._call_model, model, niche, count) for model in models_to_try]
+            
+            for future in as_completed(futures):
+                ideas = future.result()
+                if ideas:
+                    all_ideas.extend(ideas)
+                    api_success = True
+                
+                # If we have enough ideas, stop waiting for the slower models
                 if len(all_ideas) >= count:
                     break
-                    
-                try:
-                    # Calculate how many more ideas we need
-                    remaining_count = count - len(all_ideas)
-                    print(f"Attempting to generate {remaining_count} ideas with {model}")
-                    
-                    # Enhance the prompt with specific instructions for the niche AND for Shorts
-                    prompt = self._create_enhanced_prompt(niche, remaining_count)
-                    
-                    response = requests.post(
-                        "https://api.openai.com/v1/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.api_keys['openai']}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": model,
-                            "messages": [{"role": "user", "content": prompt}],
-                            "temperature": 0.7
-                        },
-                        timeout=60  # Increased from 30 to 60 seconds
-                    )
-                    
-                    if response.status_code == 200:
-                        raw_content = response.json()["choices"][0]["message"]["content"]
-                        print(f"Raw response from {model} received.")
-                        
-                        # Advanced error handling for JSON parsing
-                        try:
-                            ideas = json.loads(raw_content)
-                            
-                            # Validate each idea has required fields
-                            valid_ideas = []
-                            for idea in ideas:
-                                if all(key in idea for key in ["title", "description", "key_points", "keywords"]):
-                                    # Ensure key_points is a list
-                                    if isinstance(idea["key_points"], list) and len(idea["key_points"]) > 0:
-                                        valid_ideas.append(idea)
-                                    else:
-                                        # Fix key_points if it's not a list
-                                        if isinstance(idea["key_points"], str):
-                                            idea["key_points"] = [item.strip() for item in idea["key_points"].split(',')]
-                                            valid_ideas.append(idea)
-                            
-                            # Add valid ideas to our collection
-                            all_ideas.extend(valid_ideas)
-                            print(f"Successfully generated {len(valid_ideas)} Shorts content ideas with {model}")
-                            
-                            if len(valid_ideas) > 0:
-                                api_success = True
-                            
-                            # If we have enough ideas, break the loop
-                            if len(all_ideas) >= count:
-                                break
-                                
-                        except json.JSONDecodeError as e:
-                            print(f"Error parsing JSON from {model}: {str(e)}")
-                            # Try to extract JSON if it exists in the text
-                            extracted_ideas = self._extract_json_from_text(raw_content)
-                            if extracted_ideas:
-                                all_ideas.extend(extracted_ideas)
-                                api_success = True
-                            continue
-                    else:
-                        print(f"Error with {model}: {response.status_code}")
-                        if hasattr(response, 'text'):
-                            print(response.text)
-                        continue
-                
-                except Exception as e:
-                    print(f"Error with {model}: {str(e)}")
-                    continue
+            
+            executor.shutdown(wait=False, cancel_futures=True)
+            
+            # Drop ideas that a previous run already made a video from
+            fresh_ideas = [idea for idea in all_ideas if not self._is_known_idea(idea, niche)]
+            if len(fresh_ideas) < len(all_ideas):
+                print(f"Skipped {len(all_ideas) - len(fresh_ideas)} ideas already used in previous runs.")
+            all_ideas = fresh_ideas
         
         # PART 2: TEMPLATE-BASED GENERATION (Used for remaining ideas or if API failed)
         remaining_count = count - len(all_ideas)
@@ -258,6 +679,197 @@ class YouTubeShortsAutomationSystem:
         # Limit to requested count
         return all_ideas[:count]
     
+    def _ideas_index(self):
+        """Open the SQLite history of previously used ideas on first use."""
+        if self._ideas_db is None:
+            analytics_dir = self.config["directories"].get("analytics", "analytics")
+            try:
+                db = sqlite3.connect(os.path.join(analytics_dir, "ideas.db"), check_same_thread=False)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS used_ideas ("
+                    "title_norm TEXT, niche TEXT, title TEXT, description TEXT, keywords TEXT, "
+                    "UNIQUE(title_norm, niche))"
+                )
+                self._ideas_db = db
+            except sqlite3.Error as e:
+                print(f"Idea history unavailable: {str(e)}")
+                self._ideas_db = False
+        return self._ideas_db or None
+    
+    def _is_known_idea(self, idea, niche):
+        """Check whether an idea with the same normalized title was already used for this niche."""
+        db = self._ideas_index()
+        if db is None:
+            return False
+        
+        try:
+            with self._ideas_db_lock:
+                row = db.execute(
+                    "SELECT 1 FROM used_ideas WHERE title_norm = ? AND niche = ?",
+                    (_normalize_title(idea.get("title", "")), niche)
+                ).fetchone()
+            return row is not None
+        except sqlite3.Error:
+            return False
+    
+    def _remember_idea(self, idea, niche):
+        """Store the idea a video is being made from so later runs don't generate it again."""
+        db = self._ideas_index()
+        if db is None:
+            return
+        
+        keywords = idea.get("keywords") or []
+        if not isinstance(keywords, str):
+            keywords = " ".join(str(keyword) for keyword in keywords)
+        try:
+            with self._ideas_db_lock, db:
+                db.execute(
+                    "INSERT OR IGNORE INTO used_ideas (title_norm, niche, title, description, keywords) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (_normalize_title(idea.get("title", "")), niche, idea.get("title", ""),
+                     idea.get("description", ""), keywords)
+                )
+        except sqlite3.Error as e:
+            print(f"Could not update idea history: {str(e)}")
+    
+    def _api_cache(self):
+        """Open the SQLite cache of API responses on first use."""
+        if self._api_cache_db is None:
+            cache_dir = self.config["directories"].get("cache", "cache")
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                db = sqlite3.connect(os.path.join(cache_dir, "api_cache.db"), check_same_thread=False)
+                db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB, expires REAL)")
+                self._api_cache_db = db
+            except (OSError, sqlite3.Error) as e:
+                print(f"API response cache unavailable: {str(e)}")
+                self._api_cache_db = False
+        return self._api_cache_db or None
+    
+    def _api_cache_key(self, *parts):
+        """Build a cache key from the endpoint, model and request parameters."""
+        return hashlib.sha256(_json_dumps(parts)).hexdigest()
+    
+    def _api_cache_get(self, key):
+        """Return a cached, unexpired API response, or None."""
+        db = self._api_cache()
+        if db is None:
+            return None
+        try:
+            with self._api_cache_lock:
+                row = db.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires > ?", (key, time.time())
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+    
+    def _api_cache_set(self, key, value, ttl=_API_CACHE_TTL):
+        """Store an API response in the cache for ttl seconds."""
+        db = self._api_cache()
+        if db is None:
+            return
+        try:
+            with self._api_cache_lock, db:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)",
+                    (key, _json_dumps(value), time.time() + ttl)
+                )
+        except sqlite3.Error as e:
+            print(f"Could not cache API response: {str(e)}")
+    
+    def _coalesce(self, key, func, *args):
+        """
+        Run func(*args) once for concurrent callers that share the same key.
+        
+        Callers arriving while a request with the same key is in flight wait for it
+        and get a copy of its result instead of issuing a duplicate API call.
+        
+        Args:
+            key (tuple): Signature of the request
+            func (callable): Function that performs the request
+            
+        Returns:
+            The result of func(*args)
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        
+        if not leader:
+            return copy.copy(future.result())
+        
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _call_model(self, model, niche, count):
+        """
+        Request Shorts content ideas from a single OpenAI model.
+        
+        Args:
+            model (str): The OpenAI model name
+            niche (str): The content niche
+            count (int): Number of ideas to request
+            
+        Returns:
+            list: Valid idea dictionaries (empty if the request failed)
+        """
+        try:
+            print(f"Attempting to generate {count} ideas with {model}")
+            
+            # Enhance the prompt with specific instructions for the niche AND for Shorts
+            prompt = self._create_enhanced_prompt(niche, count)
+            
+            response = self._openai_chat(model, prompt, timeout=60)  # Increased from 30 to 60 seconds
+            
+            if response.status_code != 200:
+                print(f"Error with {model}: {response.status_code}")
+                if hasattr(response, 'text'):
+                    print(self._loggable_body(response.text))
+                return []
+            
+            raw_content = response.json()["choices"][0]["message"]["content"]
+            print(f"Raw response from {model} received.")
+            
+            # Advanced error handling for JSON parsing
+            try:
+                ideas = json.loads(raw_content)
+            except json.JSONDecodeError as e:
+                print(f"Error parsing JSON from {model}: {str(e)}")
+                # Try to extract JSON if it exists in the text
+                return self._extract_json_from_text(raw_content)
+            
+            # Validate each idea has required fields
+            valid_ideas = []
+            for idea in ideas:
+                if all(key in idea for key in _REQUIRED_IDEA_KEYS):
+                    # Ensure key_points is a list
+                    if isinstance(idea["key_points"], list) and len(idea["key_points"]) > 0:
+                        valid_ideas.append(idea)
+                    else:
+                        # Fix key_points if it's not a list
+                        if isinstance(idea["key_points"], str):
+                            idea["key_points"] = [item.strip() for item in idea["key_points"].split(',')]
+                            valid_ideas.append(idea)
+            
+            print(f"Successfully generated {len(valid_ideas)} Shorts content ideas with {model}")
+            return valid_ideas
+        
+        except Exception as e:
+            print(f"Error with {model}: {str(e)}")
+            return []
+    
     def _create_enhanced_prompt(self, niche, count):
         """Create a detailed prompt tailored to the specific niche and optimized for Shorts."""
         # Base prompt - optimized for Shorts content
@@ -292,40 +904,32 @@ class YouTubeShortsAutomationSystem:
         """
         
         # Add niche-specific instructions
-        niche_lower = niche.lower()
-        
-        if any(term in niche_lower for term in ["finance", "money", "invest", "trading", "fintech", "crypto", "wealth"]):
-            base_prompt += """
+        niche_instructions = {
+            "finance": """
             For these finance-related Shorts:
             - Include quick, actionable finance tips
             - Use striking statistics or numbers
             - Present one clear financial insight per Short
             - Make complex topics simple and digestible
             - Focus on "did you know" or "financial hacks" angles
-            """
-        
-        elif any(term in niche_lower for term in ["tech", "technology", "software", "digital", "ai", "programming"]):
-            base_prompt += """
+            """,
+            "tech": """
             For these technology-related Shorts:
             - Showcase quick tech tips or shortcuts
             - Reveal lesser-known features
             - Compare tech solutions in seconds
             - Demonstrate "before and after" tech applications
             - Use visually striking tech demonstrations
-            """
-        
-        elif any(term in niche_lower for term in ["health", "fitness", "exercise", "workout", "diet"]):
-            base_prompt += """
+            """,
+            "health": """
             For these health/fitness-related Shorts:
             - Focus on quick workout moves or health tips
             - Include impressive before/after transformations
             - Highlight common health myths to debunk
             - Use motivational hooks
             - Make complex health concepts simple and actionable
-            """
-            
-        elif any(term in niche_lower for term in ["food", "cooking", "recipe", "baking", "kitchen"]):
-            base_prompt += """
+            """,
+            "food": """
             For these food-related Shorts:
             - Focus on quick recipes or cooking hacks
             - Show dramatic food transformations
@@ -333,10 +937,11 @@ class YouTubeShortsAutomationSystem:
             - Emphasize time-saving techniques
             - Use vibrant visuals and mouth-watering descriptions
             """
+        }
+        base_prompt += niche_instructions.get(_classify_niche(niche), "")
         
         # Add time-awareness
-        current_month = datetime.now().strftime("%B")
-        current_year = datetime.now().year
+        current_month, current_year = _month_year(int(time.time() // 3600))
         base_prompt += f"""
         Since it's currently {current_month} {current_year}, consider:
         - Current tech/finance trends that are viral on social media
@@ -358,9 +963,6 @@ class YouTubeShortsAutomationSystem:
     
     def _generate_template_ideas(self, niche, count):
         """Generate ideas based on templates, with variations to ensure uniqueness. Optimized for Shorts."""
-        # Normalize the niche
-        niche_lower = niche.lower()
-        
         # Define template structures with variations optimized for Shorts
         title_templates = [
             "{n} {adj} {niche} Tips in 60 Seconds",
@@ -494,51 +1096,42 @@ class YouTubeShortsAutomationSystem:
         ]
         
         # Select appropriate templates based on niche
-        if any(term in niche_lower for term in ["finance", "money", "invest", "trading", "crypto", "wealth"]):
-            niche_template_set = title_templates + finance_templates
-        elif any(term in niche_lower for term in ["tech", "technology", "software", "digital", "ai", "programming"]):
-            niche_template_set = title_templates + tech_templates
-        elif any(term in niche_lower for term in ["health", "fitness", "exercise", "workout", "diet"]):
-            niche_template_set = title_templates + health_templates
-        elif any(term in niche_lower for term in ["food", "cooking", "recipe", "baking", "kitchen"]):
-            niche_template_set = title_templates + food_templates
-        else:
-            niche_template_set = title_templates
+        niche_templates = {
+            "finance": finance_templates,
+            "tech": tech_templates,
+            "health": health_templates,
+            "food": food_templates
+        }
+        niche_template_set = title_templates + niche_templates.get(_classify_niche(niche), [])
         
         # Generate ideas based on templates
         template_ideas = []
         niche_template_set = list(set(niche_template_set))  # Remove duplicates
         
         # Generate until we have enough ideas
+        rng = self._rng
         while len(template_ideas) < count:
-            # Pick a random template
-            template = random.choice(niche_template_set)
-            
-            # Fill in the template with random elements
-            title = template
-            for key, values in elements.items():
-                if "{" + key + "}" in title:
-                    title = title.replace("{" + key + "}", str(random.choice(values)))
-            
-            # Replace {niche} with the actual niche
-            title = title.replace("{niche}", niche)
-            
-            # Generate description and key points based on the title, optimized for Shorts
-            description = self._generate_shorts_description(title, niche)
-            key_points = self._generate_shorts_key_points(title, niche)
-            keywords = self._generate_keywords(title, niche)
-            
-            # Create the idea object
-            idea = {
-                "title": title,
-                "description": description,
-                "key_points": key_points,
-                "keywords": keywords
-            }
-            
-            # Only add if not too similar to existing ideas
-            if not self._is_duplicate(idea, template_ideas):
-                template_ideas.append(idea)
+            # Pick a batch of random templates, one per missing idea
+            for template in rng.choices(niche_template_set, k=count - len(template_ideas)):
+                # Fill in the template with random elements and the actual niche
+                title = template.format_map(_RandomPick(rng, elements, niche=niche))
+                
+                # Generate description and key points based on the title, optimized for Shorts
+                description = self._generate_shorts_description(title, niche)
+                key_points = self._generate_shorts_key_points(title, niche)
+                keywords = self._generate_keywords(title, niche)
+                
+                # Create the idea object
+                idea = {
+                    "title": title,
+                    "description": description,
+                    "key_points": key_points,
+                    "keywords": keywords
+                }
+                
+                # Only add if not too similar to existing ideas
+                if not self._is_duplicate(idea, template_ideas):
+                    template_ideas.append(idea)
         
         return template_ideas
     
@@ -564,7 +1157,7 @@ class YouTubeShortsAutomationSystem:
         ]
         
         # Return a random description
-        return random.choice(description_templates)
+        return self._rng.choice(description_templates)
     
     def _generate_shorts_key_points(self, title, niche):
         """Generate minimal key points based on the title, optimized for Shorts."""
@@ -588,10 +1181,10 @@ class YouTubeShortsAutomationSystem:
         ]
         
         # Generate 2-3 key points for Shorts
-        num_points = random.randint(2, 3)
+        num_points = self._rng.randint(2, 3)
         key_points = []
         
-        selected_starters = random.sample(point_starters, num_points)
+        selected_starters = self._rng.sample(point_starters, num_points)
         for starter in selected_starters:
             key_points.append(f"{starter} about {niche}")
         
@@ -615,11 +1208,11 @@ class YouTubeShortsAutomationSystem:
         all_keywords = base_keywords + title_words + shorts_keywords
         
         # Select 5-8 unique keywords
-        num_keywords = min(random.randint(5, 8), len(all_keywords))
+        num_keywords = min(self._rng.randint(5, 8), len(all_keywords))
         selected_keywords = []
         
         while len(selected_keywords) < num_keywords and all_keywords:
-            keyword = random.choice(all_keywords)
+            keyword = self._rng.choice(all_keywords)
             all_keywords.remove(keyword)
             if keyword not in selected_keywords:
                 selected_keywords.append(keyword)
@@ -631,20 +1224,18 @@ class YouTubeShortsAutomationSystem:
         if not existing_ideas:
             return False
         
-        new_title = new_idea["title"].lower()
+        new_words = _title_words(new_idea["title"])
+        if not new_words:
+            return False
         
         for idea in existing_ideas:
-            # Compare titles
-            existing_title = idea["title"].lower()
-            
-            # Simple similarity check (can be improved with more sophisticated methods)
-            # Count common words
-            new_words = set(new_title.split())
-            existing_words = set(existing_title.split())
-            common_words = new_words.intersection(existing_words)
+            # Compare titles by their (cached) word sets
+            existing_words = _title_words(idea["title"])
+            if not existing_words:
+                continue
             
             # Calculate similarity as proportion of common words
-            similarity = len(common_words) / min(len(new_words), len(existing_words))
+            similarity = len(new_words & existing_words) / min(len(new_words), len(existing_words))
             
             if similarity > threshold:
                 return True
@@ -656,19 +1247,24 @@ class YouTubeShortsAutomationSystem:
         if not ideas:
             return []
         
-        # Sort ideas to group similar ones
-        sorted_ideas = sorted(ideas, key=lambda x: x["title"])
-        
         # Filter out duplicates and enhance remaining ideas
         filtered_ideas = []
-        seen_titles = set()
+        seen_counts = []  # word count of each accepted title
+        postings = {}  # word -> positions in seen_counts of accepted titles containing it
         
-        for idea in sorted_ideas:
-            # Normalize title for comparison
-            norm_title = idea["title"].lower()
+        # Ideas keep their generation order (API ideas first), so the earliest of near-duplicates survives
+        for idea in ideas:
+            words = _title_words(idea["title"])
+            
+            # Walking the postings of this title's words counts the words shared with each
+            # accepted title, i.e. the intersection sizes; titles sharing no word are never visited
+            shared = {}
+            for word in words:
+                for pos in postings.get(word, ()):
+                    shared[pos] = shared.get(pos, 0) + 1
             
             # Skip if too similar to existing idea
-            if any(self._calc_similarity(norm_title, seen) > 0.7 for seen in seen_titles):
+            if any(common / min(len(words), seen_counts[pos]) > 0.7 for pos, common in shared.items()):
                 continue
             
             # Enhance the idea
@@ -676,21 +1272,12 @@ class YouTubeShortsAutomationSystem:
             
             # Add to filtered list
             filtered_ideas.append(enhanced_idea)
-            seen_titles.add(norm_title)
+            for word in words:
+                postings.setdefault(word, []).append(len(seen_counts))
+            seen_counts.append(len(words))
         
         return filtered_ideas
     
-    def _calc_similarity(self, text1, text2):
-        """Calculate simple text similarity."""
-        words1 = set(text1.split())
-        words2 = set(text2.split())
-        
-        if not words1 or not words2:
-            return 0
-        
-        common_words = words1.intersection(words2)
-        return len(common_words) / min(len(words1), len(words2))
-    
     def _enhance_idea(self, idea, niche):
         """Enhance an idea with additional details if needed."""
         # Ensure all required fields exist
@@ -719,27 +1306,18 @@ class YouTubeShortsAutomationSystem:
     
     def _format_title(self, title):
         """Properly format a title with capitalization."""
-        # Words that should not be capitalized (unless first word)
-        lowercase_words = {"a", "an", "the", "and", "but", "or", "for", "nor", "on", "at", "to", "from", "by", "in", "of"}
-        
         words = title.split()
         if not words:
             return ""
         
-        # Capitalize first and last word always
-        words[0] = words[0].capitalize()
-        if len(words) > 1:
-            words[-1] = words[-1].capitalize()
-        
-        # Handle middle words
-        for i in range(1, len(words) - 1):
-            word = words[i]
-            if word.lower() not in lowercase_words:
-                words[i] = word.capitalize()
-            else:
-                words[i] = word.lower()
+        # Capitalize first and last word always, and middle words unless they are minor words
+        last = len(words) - 1
+        formatted = [words[0].capitalize()]
+        for i, word in enumerate(words[1:], start=1):
+            word_lc = word.lower()
+            formatted.append(word_lc if i < last and word_lc in _LOWERCASE_WORDS else word.capitalize())
         
-        return " ".join(words)
+        return " ".join(formatted)
     
     def _extract_json_from_text(self, text):
         """Try to extract JSON from text that might have additional content."""
@@ -747,28 +1325,17 @@ class YouTubeShortsAutomationSystem:
         
         # Try to find JSON array in the text (improved pattern matching)
         try:
-            # Look for anything that looks like a JSON array
-            matches = re.findall(r'\[\s*\{.*?\}\s*\]', text, re.DOTALL)
-            if matches:
-                for match in matches:
-                    try:
-                        parsed = json.loads(match)
-                        if isinstance(parsed, list) and len(parsed) > 0:
-                            ideas.extend(parsed)
-                            print(f"Successfully extracted {len(parsed)} ideas")
-                    except:
-                        continue
+            # Decode anything that starts like a JSON array of objects
+            for parsed in _iter_json_values(text, _JSON_ARRAY_START_RE):
+                if isinstance(parsed, list) and len(parsed) > 0:
+                    ideas.extend(parsed)
+                    print(f"Successfully extracted {len(parsed)} ideas")
                         
             # If that fails, try to extract individual JSON objects
             if not ideas:
-                matches = re.findall(r'\{.*?\}', text, re.DOTALL)
-                for match in matches:
-                    try:
-                        parsed = json.loads(match)
-                        if isinstance(parsed, dict) and 'title' in parsed:
-                            ideas.append(parsed)
-                    except:
-                        continue
+                for parsed in _iter_json_values(text, _JSON_OBJECT_START_RE):
+                    if isinstance(parsed, dict) and 'title' in parsed:
+                        ideas.append(parsed)
         except Exception as e:
             print(f"Could not extract JSON from text: {str(e)}")
         
@@ -782,18 +1349,16 @@ class YouTubeShortsAutomationSystem:
             # 1. Ensure title is short and catchy (max 50 chars for Shorts)
             if len(idea["title"]) > 50:
                 # Truncate and add ellipsis
-                words = idea["title"].split()
-                new_title = ""
-                for word in words:
-                    if len(new_title + " " + word) <= 46:
-                        new_title += " " + word if new_title else word
-                    else:
+                parts, used = [], 0
+                for word in idea["title"].split():
+                    if used + 1 + len(word) > 46:
                         break
-                idea["title"] = new_title + "..."
+                    used += len(word) + (1 if parts else 0)
+                    parts.append(word)
+                idea["title"] = " ".join(parts) + "..."
             
             # 2. Make sure "Shorts" or related term is in keywords
-            shorts_related = ["shorts", "shortsvideo", "shortsyoutube", "tiktok", "reels"]
-            has_shorts_keyword = any(kw in shorts_related for kw in idea["keywords"])
+            has_shorts_keyword = not _SHORTS_KEYWORDS.isdisjoint(idea["keywords"])
             
             if not has_shorts_keyword:
                 idea["keywords"].append("shorts")
@@ -807,21 +1372,27 @@ class YouTubeShortsAutomationSystem:
                 # Truncate long descriptions
                 idea["description"] = idea["description"][:97] + "..."
             
+            # Cache the lowercased title and keywords for the checks below and for scoring
+            _hydrate_idea(idea)
+            
             # 5. Add a hook or question if title doesn't have one
-            lower_title = idea["title"].lower()
-            has_hook = any(q in lower_title for q in ["?", "how", "why", "this", "secret", "try"])
+            lower_title = idea["_title_lc"]
+            has_hook = any(q in lower_title for q in _SHORTS_HOOK_MARKERS)
             
             if not has_hook:
                 hooks = [
-                    f"Did you know this {random.choice(['secret', 'trick', 'hack'])}? ",
-                    f"Try this {random.choice(['now', 'today', 'immediately'])}: ",
-                    f"You've been doing {random.choice(['it', 'this'])} wrong: "
+                    f"Did you know this {self._rng.choice(['secret', 'trick', 'hack'])}? ",
+                    f"Try this {self._rng.choice(['now', 'today', 'immediately'])}: ",
+                    f"You've been doing {self._rng.choice(['it', 'this'])} wrong: "
                 ]
-                idea["title"] = random.choice(hooks) + idea["title"]
+                idea["title"] = self._rng.choice(hooks) + idea["title"]
                 
                 # Check length again after adding hook
                 if len(idea["title"]) > 50:
                     idea["title"] = idea["title"][:47] + "..."
+                
+                # Title changed, so refresh the cached forms
+                _hydrate_idea(idea)
             
             optimized_ideas.append(idea)
         
@@ -836,12 +1407,15 @@ class YouTubeShortsAutomationSystem:
             return ideas[0] if ideas else None
         
         # Score each idea based on Shorts-specific quality factors
+        niche_words = niche.lower().split()
         scored_ideas = []
         for idea in ideas:
             score = 0
             
             # 1. Title quality for Shorts (hook, length, engagement)
             title = idea['title']
+            if "_title_lc" not in idea:
+                _hydrate_idea(idea)
             
             # Ideal Shorts title length (30-45 chars)
             if 30 <= len(title) <= 45:
@@ -850,18 +1424,12 @@ class YouTubeShortsAutomationSystem:
                 score += 2
             
             # Check for hooks in title (crucial for Shorts)
-            hooks = ["?", "how", "why", "this", "secret", "hack", "try", "!"]
-            for hook in hooks:
-                if hook in title.lower():
-                    score += 2
-                    break
+            title_lc = idea["_title_lc"]
+            if any(hook in title_lc for hook in _TITLE_HOOKS):
+                score += 2
             
             # Check for power words in title
-            power_words = ["ultimate", "secret", "shocking", "proven", "powerful", 
-                          "revealed", "strategy", "fast", "quick"]
-            for word in power_words:
-                if word in title.lower():
-                    score += 1
+            score += sum(1 for word in _POWER_WORDS if word in title_lc)
             
             # 2. Key points quality (brevity is crucial for Shorts)
             key_points = idea['key_points']
@@ -881,11 +1449,8 @@ class YouTubeShortsAutomationSystem:
             keywords = idea['keywords']
             if isinstance(keywords, list):
                 # Check for Shorts-specific keywords
-                shorts_keywords = ["shorts", "shortsvideo", "tiktok", "trending", "viral"]
-                for kw in shorts_keywords:
-                    if any(kw in str(keyword).lower() for keyword in keywords):
-                        score += 2
-                        break
+                if any(kw in keyword for kw in _SCORING_SHORTS_KEYWORDS for keyword in idea["_kw_set"]):
+                    score += 2
             
             # 4. Description quality (needs to be very brief for Shorts)
             description = idea['description']
@@ -895,13 +1460,10 @@ class YouTubeShortsAutomationSystem:
                 score += 1
             
             # 5. Relevance to niche
-            niche_words = niche.lower().split()
-            relevance_score = 0
-            for word in niche_words:
-                if word in title.lower():
-                    relevance_score += 1
-                if any(word in str(kp).lower() for kp in key_points):
-                    relevance_score += 0.5
+            # (niche words contain no whitespace, so they can't match across joined key points)
+            key_points_text = "\n".join(str(kp) for kp in key_points).lower()
+            relevance_score = (sum(1 for word in niche_words if word in title_lc)
+                               + 0.5 * sum(1 for word in niche_words if word in key_points_text))
             
             score += min(relevance_score, 3)  # Cap at 3 points
             
@@ -921,23 +1483,13 @@ class YouTubeShortsAutomationSystem:
         analytics_dir = self.config['directories'].get('analytics', 'analytics')
         os.makedirs(analytics_dir, exist_ok=True)
         
-        # Load existing data if available
-        analytics_file = os.path.join(analytics_dir, "shorts_data.json")
-        video_data = []
-        
-        if os.path.exists(analytics_file):
-            try:
-                with open(analytics_file, 'r') as f:
-                    video_data = json.load(f)
-            except Exception as e:
-                print(f"Error loading analytics data: {str(e)}")
-        
         # Add new video data
+        now = datetime.now()
         new_data = {
             "video_id": video_id,
             "title": idea["title"],
             "niche": niche,
-            "created_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "created_date": now.strftime("%Y-%m-%d %H:%M:%S"),
             "keywords": idea["keywords"],
             "stats": {
                 "views": 0,
@@ -947,22 +1499,19 @@ class YouTubeShortsAutomationSystem:
             "is_short": True
         }
         
-        video_data.append(new_data)
-        
-        # Save updated data
+        # Append one JSON line to this month's file rather than rewriting the whole history
+        analytics_file = os.path.join(analytics_dir, f"shorts_data_{now:%Y%m}.jsonl")
         try:
-            with open(analytics_file, 'w') as f:
-                json.dump(video_data, f, indent=4)
+            with open(analytics_file, 'ab') as f:
+                f.write(_json_dumps(new_data) + b"\n")
         except Exception as e:
             print(f"Error saving analytics data: {str(e)}")
     
     # ======== ENHANCED SCRIPT GENERATION ========
    
     def sanitize_filename(self,filename):
-        invalid_chars = [':', '/', '\\', '?', '*', '"', '<', '>', '|', "'"]
-        for char in invalid_chars:
-            filename = filename.replace(char, '-')
-             # Replace ellipsis with just 'etc'
+        filename = filename.translate(_INVALID_FILENAME_CHARS)
+        # Replace ellipsis with just 'etc'
         filename = filename.replace('...', '-etc')
         
         # Limit length for directory names (Windows has path length limitations)
@@ -986,19 +1535,7 @@ class YouTubeShortsAutomationSystem:
                 try:
                     prompt = self._create_shorts_script_prompt(idea)
                     
-                    response = requests.post(
-                        "https://api.openai.com/v1/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.api_keys['openai']}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": model,
-                            "messages": [{"role": "user", "content": prompt}],
-                            "temperature": 0.7
-                        },
-                        timeout=60  # Longer timeout for script generation
-                    )
+                    response = self._openai_chat(model, prompt, timeout=60)  # Longer timeout for script generation
                     
                     if response.status_code == 200:
                         script = response.json()["choices"][0]["message"]["content"]
@@ -1020,7 +1557,7 @@ class YouTubeShortsAutomationSystem:
                         }
                     else:
                         print(f"Error generating script with {model} (attempt {attempt+1}): {response.status_code}")
-                        print(response.text)
+                        print(self._loggable_body(response.text))
                         continue
                         
                 except Exception as e:
@@ -1124,7 +1661,7 @@ class YouTubeShortsAutomationSystem:
             return []
         
         try:
-            response = requests.get(
+            response = self.http.get(
                 "https://api.elevenlabs.io/v1/voices",
                 headers={"xi-api-key": self.api_keys["elevenlabs"]}
             )
@@ -1134,7 +1671,7 @@ class YouTubeShortsAutomationSystem:
                 return [{"id": voice["voice_id"], "name": voice["name"]} for voice in voices]
             else:
                 print(f"Error fetching voices: {response.status_code}")
-                print(response.text)
+                print(self._loggable_body(response.text))
                 return []
         except Exception as e:
             print(f"Error in get_available_voices: {str(e)}")
@@ -1151,22 +1688,17 @@ class YouTubeShortsAutomationSystem:
             voice_id = "21m00Tcm4TlvDq8ikWAM"  # Default voice ID
         
         # Extract narrator lines from the script
-        narrator_lines = []
-        for line in script_data["content"].split('\n'):
-            if '[NARRATOR]' in line:
-                # Extract the text after [NARRATOR]
-                narrator_text = line.split('[NARRATOR]')[1].strip()
-                narrator_lines.append(narrator_text)
+        narrator_lines = [match.group(1).strip() for match in _NARRATOR_RE.finditer(script_data["content"])]
         
         # Check if we found any narrator lines
         if not narrator_lines:
             print("ERROR: No [NARRATOR] lines found in script. Voice narration cannot be generated.")
             print("Script excerpt:", script_data["content"][:500])
             # Try to extract any text as fallback
-            fallback_lines = [line.strip() for line in script_data["content"].split('\n') if line.strip()]
+            fallback_lines = [match.group().strip() for match in islice(_NON_BLANK_LINE_RE.finditer(script_data["content"]), 20)]
             if fallback_lines:
                 print("Using fallback text for narration (no [NARRATOR] tags found)")
-                narrator_lines = fallback_lines[:20]  # Limit to first 20 lines as a fallback
+                narrator_lines = fallback_lines  # Limited to first 20 lines as a fallback
             else:
                 return None
         
@@ -1180,83 +1712,48 @@ class YouTubeShortsAutomationSystem:
         chunks = self._split_into_chunks(full_narration, max_chunk_length)
         print(f"Split narration into {len(chunks)} chunks")
         
-        # Process each chunk and combine results
-        audio_chunks = []
-        for i, chunk in enumerate(chunks):
-            max_attempts = 3
-            for attempt in range(max_attempts):
-                try:
-                    print(f"Processing voice chunk {i+1}/{len(chunks)} (attempt {attempt+1}), {len(chunk)} chars")
-                    
-                    response = requests.post(
-                        f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}",  # Using provided voice_id
-                        headers={
-                            "Accept": "audio/mpeg",
-                            "Content-Type": "application/json",
-                            "xi-api-key": self.api_keys["elevenlabs"]
-                        },
-                        json={
-                            "text": chunk,
-                            "model_id": "eleven_monolingual_v1",
-                            "voice_settings": {
-                                "stability": 0.5,
-                                "similarity_boost": 0.5
-                            }
-                        },
-                        timeout=60  # Increase timeout to 60 seconds
-                    )
-                    
-                    if response.status_code == 200:
-                        # Check response size to verify it's a valid audio file
-                        content_length = len(response.content)
-                        print(f"Received audio chunk: {content_length} bytes")
-                        
-                        if content_length < 1000:  # Suspiciously small audio file
-                            print(f"WARNING: Audio chunk {i+1} is suspiciously small ({content_length} bytes)")
-                            if attempt < max_attempts - 1:
-                                print("Retrying...")
-                                continue
-                        
-                        audio_chunks.append(response.content)
-                        break  # Success, exit retry loop
-                    else:
-                        print(f"Error generating voice chunk {i+1}: {response.status_code}")
-                        print(response.text)
-                        if attempt < max_attempts - 1:  # Not the last attempt
-                            print(f"Retrying...")
-                            time.sleep(2)  # Wait before retry
-                        
-                except Exception as e:
-                    print(f"Error in generate_voice_narration chunk {i+1}: {str(e)}")
-                    if attempt < max_attempts - 1:  # Not the last attempt
-                        print(f"Retrying...")
-                        time.sleep(2)  # Wait before retry
+        # Generate the chunks concurrently, each streamed into its own part file
+        audio_dir = self.config['directories']['audio']
+        os.makedirs(audio_dir, exist_ok=True)
         
-        # If we got all chunks, combine them
-        if len(audio_chunks) == len(chunks):
-            # Combine audio chunks
-            combined_audio = b''.join(audio_chunks)
-            
+        audio_filename = script_data["filename"].replace('.txt', '.mp3').replace(
+            self.config['directories']['scripts'], 
+            self.config['directories']['audio']
+        )
+        
+        if len(chunks) == 1:
+            part_files = [audio_filename]
+        else:
+            part_files = [f"{audio_filename}.part{i}" for i in range(len(chunks))]
+        
+        max_workers = min(len(chunks), self.config.get('api_settings', {}).get('tts_workers', 4))
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            futures = [
+                executor.submit(self._tts_one_chunk, chunk, voice_id, part_file, i, len(chunks))
+                for i, (chunk, part_file) in enumerate(zip(chunks, part_files))
+            ]
+            chunk_sizes = [future.result() for future in futures]
+        
+        chunks_written = sum(1 for size in chunk_sizes if size)
+        total_bytes = sum(chunk_sizes)
+        
+        # MP3 frames are independent, so the parts can simply be concatenated in order
+        if len(part_files) > 1 and chunks_written:
+            with open(audio_filename, 'wb') as audio_file:
+                for part_file, size in zip(part_files, chunk_sizes):
+                    if size:
+                        with open(part_file, 'rb') as part:
+                            shutil.copyfileobj(part, audio_file)
+                        os.remove(part_file)
+        
+        # If we got all chunks, the file is complete
+        if chunks_written == len(chunks):
             # Check combined audio size
-            combined_size = len(combined_audio)
-            print(f"Combined audio size: {combined_size} bytes")
+            print(f"Combined audio size: {total_bytes} bytes")
             
-            if combined_size < 1000:  # Suspiciously small
+            if total_bytes < 1000:  # Suspiciously small
                 print("WARNING: Combined audio file is suspiciously small. Voice narration may be corrupted.")
             
-            # Create audio directory if it doesn't exist
-            audio_dir = self.config['directories']['audio']
-            os.makedirs(audio_dir, exist_ok=True)
-            
-            # Save the combined audio file
-            audio_filename = script_data["filename"].replace('.txt', '.mp3').replace(
-                self.config['directories']['scripts'], 
-                self.config['directories']['audio']
-            )
-            
-            with open(audio_filename, 'wb') as f:
-                f.write(combined_audio)
-            
             print(f"Voice narration generated and saved to {audio_filename}")
             
             # Verify the created audio file
@@ -1269,90 +1766,155 @@ class YouTubeShortsAutomationSystem:
             
             return audio_filename
         else:
-            print(f"Failed to generate all voice chunks ({len(audio_chunks)}/{len(chunks)} completed)")
+            print(f"Failed to generate all voice chunks ({chunks_written}/{len(chunks)} completed)")
             
-            # If we got at least one chunk, save what we have instead of returning None
-            if audio_chunks:
+            # If we got at least one chunk, keep what we have instead of returning None
+            if chunks_written:
                 print("Saving partial audio rather than failing completely")
-                combined_audio = b''.join(audio_chunks)
-                
-                # Create audio directory if it doesn't exist
-                audio_dir = self.config['directories']['audio']
-                os.makedirs(audio_dir, exist_ok=True)
-                
-                # Save the combined audio file
-                audio_filename = script_data["filename"].replace('.txt', '.mp3').replace(
-                    self.config['directories']['scripts'], 
-                    self.config['directories']['audio']
-                )
-                
-                with open(audio_filename, 'wb') as f:
-                    f.write(combined_audio)
-                
                 print(f"Partial voice narration saved to {audio_filename}")
                 return audio_filename
             
             return None
     
-    def _split_into_chunks(self, text, max_length):
-        """Split text into chunks that don't exceed max_length, preserving sentences."""
-        if not text:
-            return []
-            
+    def _tts_one_chunk(self, chunk, voice_id, part_file, index, total):
+        """
+        Generate speech for one narration chunk, streaming the audio into part_file.
+        
+        Args:
+            chunk (str): Text to synthesize
+            voice_id (str): ElevenLabs voice ID
+            part_file (str): File the audio is written to
+            index (int): Position of the chunk in the narration
+            total (int): Total number of chunks
+            
+        Returns:
+            int: Bytes of audio written (0 if every attempt failed, in which case part_file is removed)
+        """
+        # The HTTP session already retries rate limits, server errors and connection
+        # failures, so the only retry here is for a suspiciously small audio body
+        max_attempts = 2
+        with open(part_file, 'wb') as audio_file:
+            for attempt in range(max_attempts):
+                # Start every attempt from an empty file
+                audio_file.seek(0)
+                audio_file.truncate()
+                try:
+                    print(f"Processing voice chunk {index+1}/{total} (attempt {attempt+1}), {len(chunk)} chars")
+                    
+                    with self.http.post(
+                        f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}",  # Using provided voice_id
+                        headers={
+                            "Accept": "audio/mpeg",
+                            "Content-Type": "application/json",
+                            "xi-api-key": self.api_keys["elevenlabs"]
+                        },
+                        json={
+                            "text": chunk,
+                            "model_id": "eleven_monolingual_v1",
+                            "voice_settings": {
+                                "stability": 0.5,
+                                "similarity_boost": 0.5
+                            }
+                        },
+                        timeout=60,  # Increase timeout to 60 seconds
+                        stream=True
+                    ) as response:
+                        if response.status_code != 200:
+                            print(f"Error generating voice chunk {index+1}: {response.status_code}")
+                            print(self._loggable_body(response.text))
+                            break
+                        
+                        # Write the audio to disk as it downloads
+                        response.raw.decode_content = True
+                        shutil.copyfileobj(response.raw, audio_file, 1024 * 1024)
+                    
+                    content_length = audio_file.tell()
+                    print(f"Received audio chunk: {content_length} bytes")
+                    
+                    # Check response size to verify it's a valid audio file
+                    if content_length < 1000:  # Suspiciously small audio file
+                        print(f"WARNING: Audio chunk {index+1} is suspiciously small ({content_length} bytes)")
+                        if attempt < max_attempts - 1:
+                            print("Retrying...")
+                            continue
+                    
+                    return content_length  # Success
+                    
+                except Exception as e:
+                    print(f"Error in generate_voice_narration chunk {index+1}: {str(e)}")
+                    break
+        
+        os.remove(part_file)
+        return 0
+    
+    def _split_into_chunks(self, text, max_length):
+        """Split text into chunks that don't exceed max_length, preserving sentences."""
+        if not text:
+            return []
+            
         # If the text is already short enough, return it as a single chunk
         if len(text) <= max_length:
             return [text]
         
         # Split text into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         
+        # Chunks are collected as lists of pieces with a running length and joined once,
+        # instead of growing a string one sentence at a time
         chunks = []
-        current_chunk = ""
+        current_parts, current_length = [], 0
         
         for sentence in sentences:
             # If this sentence would make the chunk too long, start a new chunk
-            if len(current_chunk) + len(sentence) + 1 > max_length:
-                if current_chunk:  # Only add non-empty chunks
-                    chunks.append(current_chunk.strip())
+            if current_length + len(sentence) + 1 > max_length:
+                if current_length:  # Only add non-empty chunks
+                    chunks.append(" ".join(current_parts).strip())
                 
                 # If a single sentence is longer than max_length, split it into multiple chunks
                 if len(sentence) > max_length:
                     # Find the best place to split (at word boundaries)
-                    words = sentence.split()
-                    temp_chunk = ""
+                    temp_parts, temp_length = [], 0
                     
-                    for word in words:
-                        if len(temp_chunk) + len(word) + 1 > max_length:
-                            chunks.append(temp_chunk.strip())
-                            temp_chunk = word
+                    for word in sentence.split():
+                        if temp_length + len(word) + 1 > max_length:
+                            chunks.append(" ".join(temp_parts).strip())
+                            temp_parts, temp_length = [word], len(word)
+                        elif temp_length:
+                            temp_parts.append(word)
+                            temp_length += len(word) + 1
                         else:
-                            if temp_chunk:
-                                temp_chunk += " " + word
-                            else:
-                                temp_chunk = word
+                            temp_parts, temp_length = [word], len(word)
                     
-                    if temp_chunk:
-                        current_chunk = temp_chunk
-                    else:
-                        current_chunk = ""
+                    current_parts, current_length = temp_parts, temp_length
                 else:
-                    current_chunk = sentence
+                    current_parts, current_length = [sentence], len(sentence)
+            elif current_length:
+                current_parts.append(sentence)
+                current_length += len(sentence) + 1
             else:
-                if current_chunk:
-                    current_chunk += " " + sentence
-                else:
-                    current_chunk = sentence
+                current_parts, current_length = [sentence], len(sentence)
         
         # Add the last chunk if it's not empty
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if current_length:
+            chunks.append(" ".join(current_parts).strip())
         
         return chunks
     
     # ======== ENHANCED STOCK FOOTAGE ========
     
     def search_stock_footage(self, query, per_page=10, vertical=True):
-        """Search for stock footage with retry logic. Prioritize vertical format for Shorts."""
+        """
+        Search for stock footage with retry logic. Prioritize vertical format for Shorts.
+        
+        Returns:
+            list: One dict per video with the "url", "width", "height" and "file_size"
+                  of its best file (metadata is None when Pexels doesn't report it)
+        """
+        return self._coalesce(("videos/search", query, per_page, vertical),
+                              self._search_stock_footage, query, per_page, vertical)
+    
+    def _search_stock_footage(self, query, per_page, vertical):
+        """Query Pexels for stock footage (see search_stock_footage)."""
         if not self.api_keys["pexels"]:
             print("Pexels API key missing. Cannot search for stock footage.")
             return []
@@ -1360,55 +1922,72 @@ class YouTubeShortsAutomationSystem:
         # For Shorts, we should prioritize vertical videos
         orientation = "portrait" if vertical else "landscape"
         
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            try:
-                response = requests.get(
-                    f"https://api.pexels.com/videos/search?query={query}&per_page={per_page}&orientation={orientation}",
-                    headers={"Authorization": self.api_keys["pexels"]},
-                    timeout=30
-                )
+        cache_key = self._api_cache_key("videos/search", query, per_page, orientation)
+        cached_urls = self._api_cache_get(cache_key)
+        if cached_urls:
+            print(f"Using cached stock footage search for '{query}' ({len(cached_urls)} videos)")
+            return cached_urls
+        
+        try:
+            response = self.http.get(
+                f"https://api.pexels.com/videos/search?query={query}&per_page={per_page}&orientation={orientation}",
+                headers={"Authorization": self.api_keys["pexels"]},
+                timeout=30
+            )
+            
+            if response.status_code == 200:
+                videos = response.json()["videos"]
+                video_urls = []
                 
-                if response.status_code == 200:
-                    videos = response.json()["videos"]
-                    video_urls = []
-                    
-                    for video in videos:
-                        # Get the highest quality video file
-                        files = sorted(video["video_files"], key=lambda x: x.get("height", 0), reverse=True)
-                        
-                        # For Shorts, filter to get vertical videos if possible
-                        if vertical:
-                            vertical_files = [f for f in files if f.get("height", 0) > f.get("width", 0)]
-                            files_to_use = vertical_files if vertical_files else files
-                        else:
-                            files_to_use = files
-                            
-                        if files_to_use:
-                            video_urls.append(files_to_use[0]["link"])
-                    
-                    return video_urls
-                else:
-                    print(f"Error searching stock footage (attempt {attempt+1}): {response.status_code}")
-                    if attempt < max_attempts - 1:  # Not the last attempt
-                        print("Retrying...")
-                        time.sleep(2)  # Wait before retry
+                for video in videos:
+                    # For Shorts, only consider vertical files if there are any
+                    files = video["video_files"]
+                    if vertical:
+                        files = [f for f in files if f.get("height", 0) > f.get("width", 0)] or files
                     
-            except Exception as e:
-                print(f"Error in search_stock_footage (attempt {attempt+1}): {str(e)}")
-                if attempt < max_attempts - 1:  # Not the last attempt
-                    print("Retrying...")
-                    time.sleep(2)  # Wait before retry
+                    # Get the highest quality video file
+                    best = max(files, key=lambda x: x.get("height", 0), default=None)
+                    if best:
+                        # Keep the file's metadata so downloads can skip unusable clips
+                        video_urls.append({
+                            "url": best["link"],
+                            "width": best.get("width"),
+                            "height": best.get("height"),
+                            "file_size": best.get("file_size", best.get("size"))
+                        })
+                
+                self._api_cache_set(cache_key, video_urls)
+                return video_urls
+            else:
+                print(f"Error searching stock footage: {response.status_code}")
+                
+        except Exception as e:
+            print(f"Error in search_stock_footage: {str(e)}")
         
-        # If all portrait attempts fail but vertical was requested, try again with any orientation
+        # If the portrait search fails but vertical was requested, try again with any orientation
         if vertical:
             print("Failed to find vertical stock footage. Trying with any orientation.")
             return self.search_stock_footage(query, per_page=per_page, vertical=False)
             
-        return []  # Return empty list if all attempts fail
+        return []  # Return empty list if the search failed
     
     def download_stock_footage(self, video_urls, idea_title):
-        """Download stock footage with better error handling."""
+        """
+        Download stock footage with better error handling.
+        
+        Args:
+            video_urls (list): Clip URLs, or the dicts returned by search_stock_footage
+            idea_title (str): Title used to name the clip directory
+            
+        Returns:
+            list: Paths of the downloaded clips, in search order
+        """
+        # Skip clips the search metadata already shows are too small, unless that leaves none
+        usable_clips = [clip for clip in video_urls if _is_usable_clip(clip)]
+        if len(usable_clips) < len(video_urls):
+            print(f"Skipping {len(video_urls) - len(usable_clips)} low-resolution or tiny clips")
+        video_urls = [clip if isinstance(clip, str) else clip["url"] for clip in (usable_clips or video_urls)]
+        
         safe_title = self.sanitize_filename(idea_title)
         video_dir = f"{self.config['directories']['video']}/{safe_title.replace(' ', '_')}"
         try:
@@ -1421,49 +2000,46 @@ class YouTubeShortsAutomationSystem:
                 os.makedirs(video_dir, exist_ok=True)
                 print(f"Using fallback video directory: {video_dir}")
             
-        downloaded_files = []
-        successful_downloads = 0
         required_clips = min(6, len(video_urls))  # For Shorts, we need fewer clips
         
-        for i, url in enumerate(video_urls):
-            # If we already have enough clips, stop downloading
-            if successful_downloads >= required_clips:
-                break
-                
-            max_attempts = 3
-            for attempt in range(max_attempts):
-                try:
-                    print(f"Downloading clip {i+1}/{len(video_urls)} (attempt {attempt+1})")
-                    
-                    response = requests.get(url, stream=True, timeout=60)
-                    if response.status_code == 200:
-                        video_path = f"{video_dir}/clip_{i}.mp4"
-                        with open(video_path, 'wb') as f:
-                            for chunk in response.iter_content(chunk_size=1024*1024):
-                                if chunk:
-                                    f.write(chunk)
-                        
-                        # Verify file was downloaded correctly
-                        if os.path.getsize(video_path) > 1000:  # Ensure file isn't too small
-                            downloaded_files.append(video_path)
-                            successful_downloads += 1
-                            print(f"Successfully downloaded clip {i+1}")
-                            break  # Success, exit retry loop
-                        else:
-                            print(f"Downloaded file too small, retrying...")
-                            os.remove(video_path)  # Remove corrupted file
-                            continue
-                    else:
-                        print(f"Error downloading clip {i+1} (attempt {attempt+1}): {response.status_code}")
-                        if attempt < max_attempts - 1:  # Not the last attempt
-                            print("Retrying...")
-                            time.sleep(2)  # Wait before retry
-                
-                except Exception as e:
-                    print(f"Error downloading clip {i+1} (attempt {attempt+1}): {str(e)}")
-                    if attempt < max_attempts - 1:  # Not the last attempt
-                        print("Retrying...")
-                        time.sleep(2)  # Wait before retry
+        # Download clips concurrently, starting with twice as many as needed and topping up
+        # from the remaining URLs whenever a download fails
+        url_queue = enumerate(video_urls)
+        cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=6)
+        pending = {
+            executor.submit(self._download_clip, url, i, len(video_urls), video_dir, cancel_event)
+            for i, url in islice(url_queue, min(required_clips * 2, len(video_urls)))
+        }
+        downloaded = {}  # URL index -> clip path
+        
+        while pending and len(downloaded) < required_clips:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result:
+                    downloaded[result[0]] = result[1]
+                else:
+                    for i, url in islice(url_queue, 1):
+                        pending.add(executor.submit(self._download_clip, url, i, len(video_urls), video_dir, cancel_event))
+        
+        # We have enough clips, so stop any downloads still in flight
+        cancel_event.set()
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        
+        # Downloads that finished before noticing the cancellation still count
+        for future in pending:
+            if not future.cancelled() and future.result():
+                index, clip_path = future.result()
+                downloaded[index] = clip_path
+        
+        # Keep the clips in search order, dropping any beyond what we need
+        downloaded_files = [downloaded[i] for i in sorted(downloaded)]
+        for extra_file in downloaded_files[required_clips:]:
+            os.remove(extra_file)
+        downloaded_files = downloaded_files[:required_clips]
         
         # Check if we have enough clips
         if len(downloaded_files) < 2:  # For Shorts, even 2 clips may be enough
@@ -1472,215 +2048,269 @@ class YouTubeShortsAutomationSystem:
         
         return downloaded_files
     
+    def _download_clip(self, url, index, total, video_dir, cancel_event):
+        """
+        Download one stock footage clip.
+        
+        Args:
+            url (str): Clip URL
+            index (int): Position of the URL in the search results
+            total (int): Number of URLs in the search results
+            video_dir (str): Directory the clip is saved to
+            cancel_event (threading.Event): Set when enough clips have been downloaded
+            
+        Returns:
+            tuple: (index, clip path), or None if the download failed or was cancelled
+        """
+        video_path = f"{video_dir}/clip_{index}.mp4"
+        if cancel_event.is_set():
+            return None
+        
+        try:
+            print(f"Downloading clip {index+1}/{total}")
+            
+            # The session retries connection errors and 429/5xx responses itself
+            # (closing the response hands its pooled connection back even if the body is not read)
+            with self.http.get(url, stream=True, timeout=60) as response:
+                if response.status_code != 200:
+                    print(f"Error downloading clip {index+1}: {response.status_code}")
+                    return None
+                
+                with open(video_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1024*1024):
+                        if cancel_event.is_set():
+                            break
+                        if chunk:
+                            f.write(chunk)
+                    clip_size = f.tell()
+            
+            if cancel_event.is_set():
+                os.remove(video_path)  # Remove the partial file
+                return None
+            
+            # Verify file was downloaded correctly
+            if clip_size > 1000:  # Ensure file isn't too small
+                print(f"Successfully downloaded clip {index+1}")
+                return index, video_path
+            else:
+                print(f"Downloaded clip {index+1} is too small, skipping it")
+                os.remove(video_path)  # Remove corrupted file
+        
+        except Exception as e:
+            print(f"Error downloading clip {index+1}: {str(e)}")
+            if os.path.exists(video_path):
+                os.remove(video_path)  # Remove the partial file
+        
+        return None
+    
     # ======== ENHANCED THUMBNAIL GENERATION ========
 
     def create_thumbnail(self, idea):
         """Create a thumbnail with retry logic and fallback. Optimized for Shorts."""
+        return self._coalesce(("thumbnail", idea['title']), self._create_thumbnail, idea)
+    
+    def _create_thumbnail(self, idea):
+        """Generate the thumbnail image for an idea (see create_thumbnail)."""
+        # Use a consistent naming pattern without _Short suffix so names match
+        # what the web interface expects
+        thumbnails_dir = self.config['directories']['thumbnails']
+        thumbnail_path = f"{thumbnails_dir}/{self.sanitize_filename(idea['title'])}.png"
+        
         if not self.api_keys["openai"]:
             print("OpenAI API key missing. Cannot generate thumbnail.")
-            safe_title = self.sanitize_filename(idea['title'])
-            thumbnail_path = f"{self.config['directories']['thumbnails']}/{safe_title}.png"
-            
             return self._create_placeholder_thumbnail(
                 thumbnail_path, 
                 idea['title']
             )
         
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            try:
-                # First, generate a thumbnail description optimized for Shorts
-                prompt = f"""
-                Describe an eye-catching thumbnail image for a YouTube Short video titled:
-                "{idea['title']}"
-                
-                The description should be detailed but concise (less than 200 words).
-                Important requirements for Shorts thumbnails:
-                - MUST be in VERTICAL format (taller than wide, 9:16 ratio)
-                - Focus on a single striking visual element
-                - Bold, large text overlay that's readable on small screens
-                - Bright, high-contrast colors
-                - Simple background with clear foreground subject
-                - Emotionally engaging (surprising, intriguing, or exciting)
-                """
-                
-                # Generate description
-                response = requests.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_keys['openai']}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "gpt-3.5-turbo",  # Use cheaper model for description
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.7
-                    },
-                    timeout=45  # Increased timeout
-                )
-                
-                if response.status_code == 200:
-                    thumbnail_desc = response.json()["choices"][0]["message"]["content"]
-                    print(f"Thumbnail description generated ({len(thumbnail_desc)} chars)")
-                    
-                    # Generate image
-                    models_to_try = ["dall-e-3", "dall-e-2"]
-                    for model in models_to_try:
-                        try:
-                            # Get main topic and keywords from title and description
-                            title_words = idea['title'].split()
-                            keywords = []
-                            if len(title_words) > 5:
-                                keywords = title_words[:5]  # Take first 5 words max
-                            else:
-                                keywords = title_words
-                                
-                            # Create a shortened prompt
-                            shortened_desc = thumbnail_desc
-                            if model == "dall-e-2":
-                                # For DALL-E 2, we need a much shorter prompt
-                                # Extract first 2 sentences max
-                                sentences = thumbnail_desc.split('.')[:2]
-                                shortened_desc = '.'.join(sentences)
-                                
-                                # Limit to 100 characters
-                                if len(shortened_desc) > 100:
-                                    shortened_desc = shortened_desc[:97] + "..."
+        try:
+            # First, generate a thumbnail description optimized for Shorts
+            prompt = f"""
+            Describe an eye-catching thumbnail image for a YouTube Short video titled:
+            "{idea['title']}"
+            
+            The description should be detailed but concise (less than 200 words).
+            Important requirements for Shorts thumbnails:
+            - MUST be in VERTICAL format (taller than wide, 9:16 ratio)
+            - Focus on a single striking visual element
+            - Bold, large text overlay that's readable on small screens
+            - Bright, high-contrast colors
+            - Simple background with clear foreground subject
+            - Emotionally engaging (surprising, intriguing, or exciting)
+            """
+            
+            thumbnail_desc = self._thumbnail_description(prompt)
+            
+            # Generate image
+            if thumbnail_desc:
+                models_to_try = ["dall-e-3", "dall-e-2"]
+                for model in models_to_try:
+                    try:
+                        # Get main topic and keywords from title and description
+                        title_words = idea['title'].split()
+                        keywords = []
+                        if len(title_words) > 5:
+                            keywords = title_words[:5]  # Take first 5 words max
+                        else:
+                            keywords = title_words
                             
-                            # Build the prompt with controlled length
-                            base_prompt = f"YouTube Shorts thumbnail for: {' '.join(keywords)}. {shortened_desc}"
-                            style_prompt = "Vertical format 9:16 ratio, bright colors, simple bold text, perfect for mobile viewing."
+                        # Create a shortened prompt
+                        shortened_desc = thumbnail_desc
+                        if model == "dall-e-2":
+                            # For DALL-E 2, we need a much shorter prompt
+                            # Extract first 2 sentences max
+                            sentences = thumbnail_desc.split('.')[:2]
+                            shortened_desc = '.'.join(sentences)
                             
-                            # Check total length and trim if needed
+                            # Limit to 100 characters
+                            if len(shortened_desc) > 100:
+                                shortened_desc = shortened_desc[:97] + "..."
+                        
+                        # Build the prompt with controlled length
+                        base_prompt = f"YouTube Shorts thumbnail for: {' '.join(keywords)}. {shortened_desc}"
+                        style_prompt = "Vertical format 9:16 ratio, bright colors, simple bold text, perfect for mobile viewing."
+                        
+                        # Check total length and trim if needed
+                        total_prompt = f"{base_prompt} {style_prompt}"
+                        if len(total_prompt) > 950:  # Buffer below 1000 limit
+                            # Trim the base prompt part
+                            available_length = 950 - len(style_prompt) - 1
+                            base_prompt = base_prompt[:available_length - 3] + "..."
                             total_prompt = f"{base_prompt} {style_prompt}"
-                            if len(total_prompt) > 950:  # Buffer below 1000 limit
-                                # Trim the base prompt part
-                                available_length = 950 - len(style_prompt) - 1
-                                base_prompt = base_prompt[:available_length - 3] + "..."
-                                total_prompt = f"{base_prompt} {style_prompt}"
-                            
-                            print(f"Using {model} with prompt length: {len(total_prompt)}")
+                        
+                        print(f"Using {model} with prompt length: {len(total_prompt)}")
+                        
+                        response = self._openai_image(model, total_prompt, timeout=60)  # Square image; cropped to 9:16 below
+                        
+                        if response.status_code == 200:
+                            response_data = response.json()
+                            if self.config.get("debug"):
+                                # Leave the inline image out of the dump; it is megabytes of base64
+                                loggable = dict(response_data, data=[
+                                    {key: (f"<{len(value)} base64 chars>" if key == "b64_json" else value)
+                                     for key, value in image.items()}
+                                    for image in response_data.get("data") or []
+                                ])
+                                print(f"DALL-E response received: {json.dumps(loggable, indent=2)}")
                             
-                            response = requests.post(
-                                "https://api.openai.com/v1/images/generations",
-                                headers={
-                                    "Authorization": f"Bearer {self.api_keys['openai']}",
-                                    "Content-Type": "application/json"
-                                },
-                                json={
-                                    "prompt": total_prompt,
-                                    "n": 1,
-                                    "size": "1024x1024",  # Best for Shorts, we'll crop as needed
-                                    "model": model
-                                },
-                                timeout=60  # Increased timeout for image generation
-                            )
+                            images = response_data.get("data") or [{}]
+                            image_bytes = None
+                            if "b64_json" in images[0]:
+                                # The image comes back inline, so there is nothing left to download
+                                image_bytes = base64.b64decode(images[0]["b64_json"])
+                                print(f"Image received: {len(image_bytes)} bytes")
+                            elif "url" in images[0]:
+                                print(f"Image URL received: {images[0]['url']}")
+                                image_bytes = self._download_image(images[0]["url"])
+                            else:
+                                print(f"Error: Missing image data in DALL-E response: {self._loggable_body(str(response_data))}")
                             
-                            if response.status_code == 200:
-                                response_data = response.json()
-                                print(f"DALL-E response received: {json.dumps(response_data, indent=2)}")
-                                
-                                if "data" in response_data and len(response_data["data"]) > 0 and "url" in response_data["data"][0]:
-                                    image_url = response_data["data"][0]["url"]
-                                    print(f"Image URL received: {image_url}")
+                            if image_bytes:
+                                try:
+                                    # Create the thumbnails directory if it doesn't exist
+                                    os.makedirs(thumbnails_dir, exist_ok=True)
+                                    thumbnail_size = self._save_vertical_image(image_bytes, thumbnail_path)
                                     
-                                    # Download the image with better error handling
-                                    try:
-                                        img_response = requests.get(image_url, timeout=30, stream=True)
-                                        if img_response.status_code == 200:
-                                            # Create the thumbnails directory if it doesn't exist
-                                            thumbnails_dir = self.config['directories']['thumbnails']
-                                            os.makedirs(thumbnails_dir, exist_ok=True)
-                                            
-                                            # Get content length to verify we have data
-                                            content_length = int(img_response.headers.get('content-length', 0))
-                                            if content_length == 0:
-                                                print("Warning: Image has zero content length")
-                                            
-                                            # IMPORTANT FIX: Use consistent naming pattern without _Short suffix
-                                            # This ensures names match what the web interface expects
-                                            safe_title = self.sanitize_filename(idea['title'])
-                                            thumbnail_path = f"{thumbnails_dir}/{safe_title}.png"
-                                            
-                                            with open(thumbnail_path, 'wb') as f:
-                                                for chunk in img_response.iter_content(chunk_size=8192):
-                                                    if chunk:
-                                                        f.write(chunk)
-                                            
-                                            # Process the image to ensure it's vertical format for Shorts
-                                            try:
-                                                from PIL import Image
-                                                
-                                                # Open and convert to vertical format if needed
-                                                img = Image.open(thumbnail_path)
-                                                width, height = img.size
-                                                
-                                                # If it's not already vertical, crop it to be vertical (9:16 ratio)
-                                                if width >= height:
-                                                    # Calculate new width for 9:16 ratio
-                                                    new_width = int(height * 9/16)
-                                                    # Center crop
-                                                    left = (width - new_width) // 2
-                                                    right = left + new_width
-                                                    img = img.crop((left, 0, right, height))
-                                                    # Save the cropped image
-                                                    img.save(thumbnail_path)
-                                                    print(f"Image cropped to vertical format (9:16 ratio)")
-                                            except Exception as e:
-                                                print(f"Error processing thumbnail to vertical format: {str(e)}")
-                                            
-                                            # Verify the file was written successfully
-                                            if os.path.getsize(thumbnail_path) > 0:
-                                                print(f"✓ Shorts thumbnail generated with {model} and saved to {thumbnail_path} ({os.path.getsize(thumbnail_path)} bytes)")
-                                                return thumbnail_path
-                                            else:
-                                                print(f"✗ Thumbnail file was created but has 0 bytes: {thumbnail_path}")
-                                                # Try to create a simple placeholder instead
-                                                if self._create_placeholder_thumbnail(thumbnail_path, idea['title']):
-                                                    print(f"✓ Created placeholder thumbnail instead: {thumbnail_path}")
-                                                    return thumbnail_path
-                                        else:
-                                            print(f"Error downloading thumbnail: {img_response.status_code}")
-                                            print(f"Response: {img_response.text}")
-                                    except Exception as e:
-                                        print(f"Error downloading or saving thumbnail: {str(e)}")
-                                else:
-                                    print(f"Error: Missing 'data' or 'url' in DALL-E response: {response_data}")
-                            else:
-                                print(f"Error generating thumbnail with {model}: {response.status_code}")
-                                if hasattr(response, 'text'):
-                                    print(response.text)
-                                continue
-                        except Exception as e:
-                            print(f"Error with {model} thumbnail generation: {str(e)}")
+                                    # Verify the file was written successfully
+                                    if thumbnail_size > 0:
+                                        print(f"✓ Shorts thumbnail generated with {model} and saved to {thumbnail_path} ({thumbnail_size} bytes)")
+                                        return thumbnail_path
+                                    else:
+                                        print(f"✗ Thumbnail file was created but has 0 bytes: {thumbnail_path}")
+                                        # Try to create a simple placeholder instead
+                                        if self._create_placeholder_thumbnail(thumbnail_path, idea['title']):
+                                            print(f"✓ Created placeholder thumbnail instead: {thumbnail_path}")
+                                            return thumbnail_path
+                                except Exception as e:
+                                    print(f"Error saving thumbnail: {str(e)}")
+                        else:
+                            print(f"Error generating thumbnail with {model}: {response.status_code}")
+                            if hasattr(response, 'text'):
+                                print(self._loggable_body(response.text))
                             continue
-                else:
-                    print(f"Error generating thumbnail description (attempt {attempt+1}): {response.status_code}")
-                    if hasattr(response, 'text'):
-                        print(response.text)
-                    if attempt < max_attempts - 1:  # Not the last attempt
-                        print("Retrying...")
-                        time.sleep(2)  # Wait before retry
+                    except Exception as e:
+                        print(f"Error with {model} thumbnail generation: {str(e)}")
+                        continue
             
-            except Exception as e:
-                print(f"Error in create_thumbnail (attempt {attempt+1}): {str(e)}")
-                if attempt < max_attempts - 1:  # Not the last attempt
-                    print("Retrying...")
-                    time.sleep(2)  # Wait before retry
+        except Exception as e:
+            print(f"Error in create_thumbnail: {str(e)}")
         
-        # If all attempts fail, create a placeholder
-        print("All thumbnail generation attempts failed. Creating placeholder.")
-        safe_title = self.sanitize_filename(idea['title'])
-        thumbnail_path = f"{self.config['directories']['thumbnails']}/{safe_title}.png"
+        # If thumbnail generation failed, create a placeholder
+        print("Thumbnail generation failed. Creating placeholder.")
         if self._create_placeholder_thumbnail(thumbnail_path, idea['title'], vertical=True):
             return thumbnail_path
         else:
             return None
 
+    def _thumbnail_description(self, prompt):
+        """Return a thumbnail description for prompt, reusing a cached one; None if the request failed."""
+        cache_key = self._api_cache_key("chat/completions", "gpt-3.5-turbo", prompt)
+        thumbnail_desc = self._api_cache_get(cache_key)
+        if thumbnail_desc is not None:
+            print(f"Using cached thumbnail description ({len(thumbnail_desc)} chars)")
+            return thumbnail_desc
+        
+        response = self._openai_chat("gpt-3.5-turbo", prompt, timeout=45)  # Use cheaper model for description
+        if response.status_code != 200:
+            print(f"Error generating thumbnail description: {response.status_code}")
+            if hasattr(response, 'text'):
+                print(self._loggable_body(response.text))
+            return None
+        
+        thumbnail_desc = response.json()["choices"][0]["message"]["content"]
+        self._api_cache_set(cache_key, thumbnail_desc)
+        print(f"Thumbnail description generated ({len(thumbnail_desc)} chars)")
+        return thumbnail_desc
+    
+    def _download_image(self, image_url):
+        """Download a generated image, returning its bytes or None on failure."""
+        try:
+            img_response = self.http.get(image_url, timeout=30)
+            if img_response.status_code != 200:
+                print(f"Error downloading thumbnail: {img_response.status_code}")
+                print(f"Response: {self._loggable_body(img_response.text)}")
+                return None
+            
+            if not img_response.content:
+                print("Warning: Image has zero content length")
+            return img_response.content
+        except Exception as e:
+            print(f"Error downloading thumbnail: {str(e)}")
+            return None
+    
+    def _save_vertical_image(self, image_bytes, path):
+        """Write an image to path, center-cropping it to 9:16 in memory first if it isn't vertical; return bytes written."""
+        cropped_img = None
+        try:
+            from PIL import Image
+            
+            img = Image.open(io.BytesIO(image_bytes))
+            width, height = img.size
+            
+            # If it's not already vertical, crop it to be vertical (9:16 ratio)
+            if width >= height:
+                # Calculate new width for 9:16 ratio
+                new_width = int(height * 9/16)
+                # Center crop
+                left = (width - new_width) // 2
+                right = left + new_width
+                cropped_img = img.crop((left, 0, right, height))
+        except Exception as e:
+            print(f"Error processing thumbnail to vertical format: {str(e)}")
+        
+        with open(path, 'wb') as f:
+            if cropped_img is not None:
+                cropped_img.save(f, format="PNG")
+                print(f"Image cropped to vertical format (9:16 ratio)")
+            else:
+                # Already vertical (or unreadable by PIL): keep the bytes as they are
+                f.write(image_bytes)
+            return f.tell()
+    
     def _create_placeholder_thumbnail(self, path, title, vertical=True):
         """Create a simple placeholder thumbnail with PIL, optimized for vertical format."""
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
             
             if vertical:
                 # Create a blank image with a vertical (9:16) aspect ratio
@@ -1697,51 +2327,28 @@ class YouTubeShortsAutomationSystem:
             else:
                 draw.rectangle([(40, 40), (1240, 680)], outline=(100, 100, 200), width=8)
             
-            # Draw a gradient background (simple version)
+            # Draw a gradient background (simple version): build one column of colors
+            # from dark blue to light blue and stretch it across the box
             if vertical:
-                # Vertical gradient
-                for y in range(80, 1200):
-                    # Create a gradient from dark blue to light blue
-                    color = (
-                        int(33 + (y/1200) * 60),  # R value
-                        int(33 + (y/1200) * 70),  # G value
-                        int(100 + (y/1200) * 155)  # B value
-                    )
-                    draw.line([(80, y), (640, y)], fill=color)
+                left, top, right, bottom, span = 80, 80, 640, 1199, 1200  # Vertical gradient
             else:
-                # Horizontal gradient
-                for y in range(80, 640):
-                    # Create a gradient from dark blue to light blue
-                    color = (
-                        int(33 + (y/640) * 60),  # R value
-                        int(33 + (y/640) * 70),  # G value
-                        int(100 + (y/640) * 155)  # B value
-                    )
-                    draw.line([(80, y), (1200, y)], fill=color)
+                left, top, right, bottom, span = 80, 80, 1200, 639, 640  # Horizontal gradient
+            
+            gradient = Image.new('RGB', (1, bottom - top + 1))
+            gradient.putdata([
+                (
+                    int(33 + (y/span) * 60),  # R value
+                    int(33 + (y/span) * 70),  # G value
+                    int(100 + (y/span) * 155)  # B value
+                )
+                for y in range(top, bottom + 1)
+            ])
+            img.paste(gradient.resize((right - left + 1, bottom - top + 1), Image.NEAREST), (left, top))
             
             # Add title text
             try:
-                # Try to use a default font
-                font = None
-                try:
-                    # Try a few different system fonts
-                    for font_name in ['arial.ttf', 'Arial.ttf', 'Verdana.ttf', 'times.ttf', 'Times.ttf', 'Courier.ttf']:
-                        try:
-                            if vertical:
-                                font = ImageFont.truetype(font_name, 80)  # Larger font for vertical
-                            else:
-                                font = ImageFont.truetype(font_name, 60)
-                            break
-                        except:
-                            continue
-                except:
-                    pass
-                    
-                if font is None:
-                    try:
-                        font = ImageFont.load_default()
-                    except:
-                        pass
+                # Larger font for vertical thumbnails
+                font = _load_font(80 if vertical else 60)
                     
                 # Prepare the title (shorten if needed)
                 text = title
@@ -1835,9 +2442,11 @@ class YouTubeShortsAutomationSystem:
         output_dir = self.config['directories']['output']
         os.makedirs(output_dir, exist_ok=True)
         
-        # Create the output filename
-        safe_title = self.sanitize_filename(idea_title)
-        final_output = f"{output_dir}/{safe_title.replace(' ', '_')}_Short.mp4"
+        # Create the output filenames
+        file_title = self.sanitize_filename(idea_title).replace(' ', '_')
+        final_output = f"{output_dir}/{file_title}_Short.mp4"
+        alternate_output = f"{output_dir}/{file_title}_alt_short.mp4"
+        scratch_dir = None
         
         try:
             # SECTION 1: VERIFY INPUTS
@@ -1861,163 +2470,34 @@ class YouTubeShortsAutomationSystem:
                 
             print(f"Found {len(video_clips)} video clips to process")
             
-            # Create a directory for temporary files
-            safe_title_dir = self.sanitize_filename(idea_title)
-            video_dir = f"{self.config['directories']['video']}/{safe_title_dir.replace(' ', '_')}"
-            os.makedirs(video_dir, exist_ok=True)
-            
-            # SECTION 2: STANDARDIZE CLIPS FOR SHORTS (VERTICAL FORMAT)
-            # Standardize all clips to vertical format for Shorts
-            standardized_clips = []
-            for i, clip in enumerate(video_clips):
-                std_clip = f"{video_dir}/std_clip_{i}.mp4"
-                print(f"Standardizing clip {i+1}/{len(video_clips)} for Shorts...")
-                
-                try:
-                    # For Shorts, we need vertical format (9:16 aspect ratio)
-                    # Use 720x1280 as the standard vertical resolution for Shorts
-                    subprocess.run([
-                        "ffmpeg", "-y", "-i", clip, 
-                        "-vf", "scale=720:1280:force_original_aspect_ratio=decrease,pad=720:1280:(ow-iw)/2:(oh-ih)/2",
-                        "-c:v", "libx264", "-preset", "medium", "-crf", "23",
-                        "-pix_fmt", "yuv420p", std_clip
-                    ], capture_output=True, check=True)
-                    
-                    standardized_clips.append(std_clip)
-                except subprocess.CalledProcessError as e:
-                    print(f"Error standardizing clip {i+1}:")
-                    print(e.stderr.decode())
-                    # Try a simpler conversion as fallback
-                    try:
-                        # Simpler approach that at least ensures vertical orientation
-                        subprocess.run([
-                            "ffmpeg", "-y", "-i", clip, 
-                            "-vf", "scale=720:1280:force_original_aspect_ratio=decrease,pad=720:1280:(ow-iw)/2:(oh-ih)/2",
-                            "-c:v", "libx264", std_clip
-                        ], capture_output=True, check=True)
-                        standardized_clips.append(std_clip)
-                    except subprocess.CalledProcessError as e:
-                        print(f"Fallback conversion also failed for clip {i+1}")
-                        print(e.stderr.decode())
-                        continue
+            # Create a scratch directory for the intermediate files, in RAM when there is
+            # room for them; only final_output ends up in the output directory
+            scratch_dir = tempfile.mkdtemp(prefix=f"{file_title}_", dir=_scratch_parent())
             
-            if not standardized_clips:
-                print("No clips could be standardized for Shorts format. Aborting.")
-                return None
+            # SECTION 2: STANDARDIZE CLIPS FOR SHORTS (VERTICAL FORMAT) AND CONCATENATE THEM
+            # The audio does not depend on the clips, so its duration check and truncation
+            # (SECTION 4) run in the background while the clips are being processed
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                audio_future = executor.submit(self._prepare_shorts_audio, audio_file, scratch_dir)
                 
-            # SECTION 3: CONCATENATE CLIPS INTO ONE VIDEO
-            concat_output = f"{video_dir}/concat_output.mp4"
-            
-            # Create a file list for FFmpeg's concat demuxer
-            clips_list_path = f"{video_dir}/clips_list.txt"
-            with open(clips_list_path, 'w') as f:
-                for clip in standardized_clips:
-                    f.write(f"file '{os.path.abspath(clip)}'\n")
-            
-            # Method 1: Use concat demuxer (faster, but less reliable)
-            concat_success = False
-            try:
-                print("Running FFmpeg to concatenate clips (Method 1)...")
-                subprocess.run([
-                    "ffmpeg", "-y", "-f", "concat", "-safe", "0", 
-                    "-i", clips_list_path, "-c:v", "libx264", 
-                    "-pix_fmt", "yuv420p", concat_output
-                ], capture_output=True, check=True)
-                concat_success = True
-            except subprocess.CalledProcessError as e:
-                print("Method 1 failed. Trying Method 2...")
-                print(e.stderr.decode())
-                
-                # Method 2: Use filtergraph (slower, but more reliable)
-                try:
-                    # Build the complex filtergraph
-                    filter_parts = []
-                    for i in range(len(standardized_clips)):
-                        filter_parts.append(f"[{i}:v]")
-                    
-                    filter_complex = "".join(filter_parts) + f"concat=n={len(standardized_clips)}:v=1:a=0[outv]"
-                    
-                    # Build the input arguments
-                    input_args = []
-                    for clip in standardized_clips:
-                        input_args.extend(["-i", clip])
-                    
-                    # Run FFmpeg with the complex filter
-                    subprocess.run(
-                        ["ffmpeg", "-y"] + input_args + [
-                            "-filter_complex", filter_complex, 
-                            "-map", "[outv]", 
-                            "-c:v", "libx264", 
-                            "-pix_fmt", "yuv420p", 
-                            concat_output
-                        ], capture_output=True, check=True
-                    )
-                    concat_success = True
-                except subprocess.CalledProcessError as e:
-                    print("Method 2 failed as well")
-                    print(e.stderr.decode())
-                    return None
-            
-            if not concat_success or not os.path.exists(concat_output):
-                print("Failed to concatenate clips. Aborting.")
-                return None
-            
-            # SECTION 4: GET AUDIO DURATION
-            # Get audio duration using ffprobe
-            audio_duration = 0
-            try:
-                # Try ffprobe first (most accurate)
-                result = subprocess.run([
-                    "ffprobe", 
-                    "-v", "error", 
-                    "-show_entries", "format=duration", 
-                    "-of", "default=noprint_wrappers=1:nokey=1", 
-                    audio_file
-                ], capture_output=True, text=True, check=True)
-                
-                audio_duration = float(result.stdout.strip())
-                print(f"Audio duration: {audio_duration:.2f} seconds")
-            except:
-                # Fallback to ffmpeg if ffprobe fails
-                try:
-                    result = subprocess.run([
-                        "ffmpeg", "-i", audio_file, "-f", "null", "-"
-                    ], capture_output=True, text=True)
-                    
-                    # Extract duration with regex
-                    duration_match = re.search(r"Duration: (\d{2}):(\d{2}):(\d{2}\.\d{2})", result.stderr)
-                    if duration_match:
-                        h, m, s = duration_match.groups()
-                        audio_duration = float(h) * 3600 + float(m) * 60 + float(s)
-                        print(f"Audio duration (from ffmpeg): {audio_duration:.2f} seconds")
-                    else:
-                        print("Couldn't determine audio duration, using default of 60 seconds (max for Shorts)")
-                        audio_duration = 60  # Default to 60 seconds max for Shorts
-                except:
-                    print("Failed to determine audio duration. Using default of 60 seconds.")
-                    audio_duration = 60  # Default to 60 seconds max for Shorts
-            
-            # Check if audio exceeds Shorts limit
-            if audio_duration > 60:
-                print(f"WARNING: Audio duration ({audio_duration:.2f} seconds) exceeds YouTube Shorts limit of 60 seconds.")
-                print("Truncating to 60 seconds...")
-                audio_duration = 60
+                # Scale, pad and join all clips in a single FFmpeg run; if that fails, try a
+                # single run over the concat demuxer, then standardizing clips one at a time
+                concat_output = f"{scratch_dir}/concat_output.mp4"
+                streams = [self._probe_video_stream(clip) for clip in video_clips]
+                if len(video_clips) == 1 and _is_shorts_stream(streams[0]):
+                    # A single clip that already matches needs no joining at all
+                    concat_output = video_clips[0]
+                    print("The only clip already matches the Shorts format; using it as is")
+                elif _can_stream_concat(streams) and \
+                        self._concat_without_reencoding(video_clips, scratch_dir, concat_output):
+                    print("All clips already match the Shorts format; joined them without re-encoding")
+                elif not self._standardize_and_concat(video_clips, concat_output) and \
+                        not self._standardize_with_concat_demuxer(video_clips, scratch_dir, concat_output):
+                    print("Falling back to standardizing clips one at a time...")
+                    if not self._standardize_clips_separately(video_clips, scratch_dir, concat_output):
+                        return None
                 
-                # Create a truncated version of the audio
-                truncated_audio = f"{video_dir}/truncated_audio.mp3"
-                try:
-                    subprocess.run([
-                        "ffmpeg", "-y", "-i", audio_file, 
-                        "-t", "60", 
-                        "-c:a", "aac", truncated_audio
-                    ], capture_output=True, check=True)
-                    
-                    if os.path.exists(truncated_audio):
-                        audio_file = truncated_audio
-                        print(f"Created truncated audio file: {truncated_audio}")
-                except Exception as e:
-                    print(f"Error truncating audio: {str(e)}")
-                    # Continue with original audio, will be truncated in final output
+                audio_file, audio_duration = audio_future.result()
             
             # Verify valid audio duration
             if audio_duration < 1:
@@ -2025,80 +2505,40 @@ class YouTubeShortsAutomationSystem:
                 print("This is likely due to an issue with the audio generation.")
                 return None
             
-            # SECTION 5: PREPARE VIDEO FOR ASSEMBLY
-            # Get video duration
-            video_duration = 0
-            try:
-                result = subprocess.run([
-                    "ffprobe", 
-                    "-v", "error", 
-                    "-show_entries", "format=duration", 
-                    "-of", "default=noprint_wrappers=1:nokey=1", 
-                    concat_output
-                ], capture_output=True, text=True, check=True)
-                
-                video_duration = float(result.stdout.strip())
-                print(f"Video duration: {video_duration:.2f} seconds")
-            except:
-                print("Couldn't determine video duration. Assuming 30 seconds.")
-                video_duration = 30  # Assume 30 seconds
-            
-            # Check if video needs to be extended to match audio
-            # Extended version is needed if video is shorter than audio
-            extended_video = None
-            video_to_use = concat_output
-            
-            if video_duration < audio_duration:
-                print(f"Video ({video_duration:.2f}s) is shorter than audio ({audio_duration:.2f}s). Extending video...")
-                
-                # Calculate number of loops needed
-                loops_needed = int(audio_duration / video_duration) + 1
-                print(f"Looping video {loops_needed} times to match audio")
-                
-                extended_video = f"{video_dir}/extended_video.mp4"
-                try:
-                    # Create extended video by looping
-                    subprocess.run([
-                        "ffmpeg", "-y",
-                        "-stream_loop", str(loops_needed),
-                        "-i", concat_output,
-                        "-c", "copy",
-                        "-t", str(audio_duration + 1),  # Add 1 second buffer
-                        extended_video
-                    ], capture_output=True, check=True)
-                    
-                    if os.path.exists(extended_video):
-                        video_to_use = extended_video
-                        print("Video extended successfully")
-                    else:
-                        print("Failed to extend video. Using original concatenated video.")
-                except Exception as e:
-                    print(f"Error extending video: {e}")
-                    print("Using original concatenated video.")
-            
             # SECTION 6: COMBINE VIDEO WITH AUDIO AND ADD TEXT OVERLAYS
             # For Shorts, we may want to add text overlays based on the script
             # This would require parsing the script to extract [TEXT] tags
             
             print(f"Combining video with audio to create final Shorts video: {final_output}")
+            staging_output = f"{output_dir}/{file_title}_Short.partial.mp4"
             try:
-                # For Shorts, ensure the final video is exactly the right length
-                subprocess.run([
+                # Loop the joined clips for as long as the audio runs and mux them in one pass;
+                # concat_output is normally H.264 yuv420p already, so the video is only
+                # re-encoded if the probe says otherwise
+                stream = self._probe_video_stream(concat_output)
+                if stream and stream.get("codec_name") == "h264" and stream.get("pix_fmt") == "yuv420p":
+                    video_args = ["-c:v", "copy"]
+                else:
+                    print("Joined clips are not yuv420p H.264; re-encoding the video for the final mux")
+                    video_args = [*_h264_encoder_args(), "-pix_fmt", "yuv420p"]
+                
+                _run_ffmpeg([
                     "ffmpeg", "-y",
-                    "-i", video_to_use,
+                    "-stream_loop", "-1",  # Repeat the video if it is shorter than the audio
+                    "-i", concat_output,
                     "-i", audio_file,
-                    "-c:v", "libx264",  # Copy video with re-encoding
+                    *video_args,
                     "-c:a", "aac",      # Convert audio to AAC
                     "-map", "0:v:0",    # Take video from first input
                     "-map", "1:a:0",    # Take audio from second input
                     "-shortest",        # End when shortest input ends
                     "-t", str(min(audio_duration, 60)),  # Limit to max 60 seconds for Shorts
-                    final_output
-                ], capture_output=True, check=True)
+                    "-movflags", "+faststart",  # Put the index first so playback can start during upload processing
+                    staging_output
+                ], check=True)
                 
-                # Clean up temporary file if it exists
-                if extended_video and os.path.exists(extended_video):
-                    os.remove(extended_video)
+                # Move the finished file into place in one step, so final_output is never half-written
+                os.replace(staging_output, final_output)
                 
                 # Verify the final output
                 if os.path.exists(final_output):
@@ -2109,16 +2549,8 @@ class YouTubeShortsAutomationSystem:
                         print("WARNING: Final video file is suspiciously small")
                         
                     # Check the duration of the final video
-                    try:
-                        result = subprocess.run([
-                            "ffprobe", 
-                            "-v", "error", 
-                            "-show_entries", "format=duration", 
-                            "-of", "default=noprint_wrappers=1:nokey=1", 
-                            final_output
-                        ], capture_output=True, text=True, check=True)
-                        
-                        final_duration = float(result.stdout.strip())
+                    final_duration = self._probe_duration(final_output)
+                    if final_duration is not None:
                         print(f"Final video duration: {final_duration:.2f} seconds")
                         
                         if final_duration < 1:
@@ -2126,87 +2558,414 @@ class YouTubeShortsAutomationSystem:
                             print("Attempting alternate assembly method...")
                             
                             # Try one more method if first assembly failed
-                            alternate_output = f"{output_dir}/{idea_title.replace(' ', '_')}_alt_short.mp4"
-                            return self._alternate_shorts_video_assembly(concat_output, audio_file, alternate_output)
-                    except:
-                        pass
+                            return self._alternate_shorts_video_assembly(concat_output, audio_file, alternate_output, scratch_dir)
                     
                     return final_output
                 else:
                     print("Final video file not created. Attempting alternate method...")
                     
                     # Try one more method if first assembly failed
-                    alternate_output = f"{output_dir}/{idea_title.replace(' ', '_')}_alt_short.mp4"
-                    return self._alternate_shorts_video_assembly(concat_output, audio_file, alternate_output)
+                    return self._alternate_shorts_video_assembly(concat_output, audio_file, alternate_output, scratch_dir)
             except Exception as e:
                 print(f"Error combining video with audio: {e}")
+                if os.path.exists(staging_output):
+                    os.remove(staging_output)
                 # Try one more method if first assembly failed
-                alternate_output = f"{output_dir}/{idea_title.replace(' ', '_')}_alt_short.mp4"
-                return self._alternate_shorts_video_assembly(concat_output, audio_file, alternate_output)
+                return self._alternate_shorts_video_assembly(concat_output, audio_file, alternate_output, scratch_dir)
                 
         except Exception as e:
             print(f"Error in assemble_shorts_video: {str(e)}")
             import traceback
             traceback.print_exc()
             return None
+        finally:
+            if scratch_dir:
+                shutil.rmtree(scratch_dir, ignore_errors=True)
         
         return None
    
-    def _alternate_shorts_video_assembly(self, video_path, audio_path, output_path):
-        """Alternative video assembly method for Shorts as a fallback."""
-        print("Using alternate Shorts video assembly method...")
+    def _standardize_and_concat(self, video_clips, concat_output):
+        """
+        Scale and pad every clip to the vertical Shorts format and join them with a single FFmpeg run.
+        
+        Args:
+            video_clips (list): Paths of the downloaded clips
+            concat_output (str): Path of the joined video
+            
+        Returns:
+            bool: True if the joined video was written
+        """
+        input_args = []
+        for clip in video_clips:
+            input_args.extend(["-i", clip])
+        
+        # Standardize each input, then feed them all into the concat filter
+        clip_count = len(video_clips)
+        filter_complex = ";".join(f"[{i}:v]{_STANDARD_FRAME_FILTER}[v{i}]" for i in range(clip_count))
+        filter_complex += ";" + "".join(f"[v{i}]" for i in range(clip_count)) + f"concat=n={clip_count}:v=1:a=0[outv]"
         
         try:
-            # 1. First, get audio duration (max 60 seconds for Shorts)
-            audio_duration = 0
+            print(f"Standardizing and concatenating {clip_count} clips for Shorts in one pass...")
+            _run_ffmpeg(
+                ["ffmpeg", "-y"] + input_args + [
+                    "-filter_complex", filter_complex,
+                    "-map", "[outv]",
+                    *_h264_encoder_args(),
+                    "-pix_fmt", "yuv420p",
+                    concat_output
+                ], check=True
+            )
+        except subprocess.CalledProcessError as e:
+            print("Single-pass standardization failed:")
+            print(e.stderr.decode())
+            return False
+        
+        return os.path.exists(concat_output)
+    
+    def _prepare_shorts_audio(self, audio_file, video_dir):
+        """
+        Read the narration duration and truncate the audio to the Shorts limit if needed.
+        
+        Args:
+            audio_file (str): Path to the narration audio
+            video_dir (str): Directory for the truncated audio
+            
+        Returns:
+            tuple: (audio file to use, audio duration in seconds)
+        """
+        # Read the duration from the MP3 frames, falling back to ffprobe for other formats
+        audio_duration = _mp3_duration(audio_file) if audio_file.lower().endswith(".mp3") else None
+        if audio_duration is None:
+            audio_duration = self._probe_duration(audio_file)
+        if audio_duration is not None:
+            print(f"Audio duration: {audio_duration:.2f} seconds")
+        else:
+            print("Couldn't determine audio duration, using default of 60 seconds (max for Shorts)")
+            audio_duration = 60  # Default to 60 seconds max for Shorts
+        
+        # Check if audio exceeds Shorts limit
+        if audio_duration > 60:
+            print(f"WARNING: Audio duration ({audio_duration:.2f} seconds) exceeds YouTube Shorts limit of 60 seconds.")
+            print("Truncating to 60 seconds...")
+            audio_duration = 60
+            
+            # Create a truncated version of the audio
+            truncated_audio = f"{video_dir}/truncated_audio.mp3"
             try:
-                result = subprocess.run([
-                    "ffprobe", 
-                    "-v", "error", 
-                    "-show_entries", "format=duration", 
-                    "-of", "default=noprint_wrappers=1:nokey=1", 
-                    audio_path
-                ], capture_output=True, text=True, check=True)
-                audio_duration = min(float(result.stdout.strip()), 60)  # Cap at 60 seconds for Shorts
-            except:
-                audio_duration = 60  # Default to max Shorts duration
+                _run_ffmpeg([
+                    "ffmpeg", "-y", "-i", audio_file, 
+                    "-t", "60", 
+                    "-c:a", "aac", truncated_audio
+                ], check=True)
+                
+                if os.path.exists(truncated_audio):
+                    audio_file = truncated_audio
+                    print(f"Created truncated audio file: {truncated_audio}")
+            except Exception as e:
+                print(f"Error truncating audio: {str(e)}")
+                # Continue with original audio, will be truncated in final output
+        
+        return audio_file, audio_duration
+    
+    def _probe_duration(self, path):
+        """
+        Return a media file's duration in seconds, or None if it can't be read.
+        
+        MP4 files are read directly (see _mp4_duration); anything else goes to ffprobe.
+        
+        Results are cached by path, modification time and size, so a file that is
+        rewritten (e.g. a new concat_output) is probed again.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        if key in self._probe_cache:
+            return self._probe_cache[key]
+        
+        # MP4 files carry their duration in the movie header, so skip ffprobe for them
+        if path.lower().endswith((".mp4", ".m4a", ".mov")):
+            duration = _mp4_duration(path)
+            if duration is not None:
+                self._probe_cache[key] = duration
+                return duration
+        
+        try:
+            result = _run_ffmpeg([
+                "ffprobe",
+                "-v", "error",
+                "-print_format", "json",
+                "-show_format",
+                path
+            ], capture_output=True, text=True, check=True)
+            duration = float(json.loads(result.stdout)["format"]["duration"])
+        except (OSError, subprocess.CalledProcessError, ValueError, KeyError, TypeError):
+            return None
+        
+        self._probe_cache[key] = duration
+        return duration
+    
+    def _probe_video_stream(self, path):
+        """Return ffprobe's description of the first video stream in path, or None if it can't be read."""
+        try:
+            result = _run_ffmpeg([
+                "ffprobe", "-v", "quiet",
+                "-print_format", "json",
+                "-show_streams", "-select_streams", "v:0",
+                "-show_data_hash", "sha256",  # Adds extradata_hash, to compare codec parameters
+                path
+            ], capture_output=True, text=True, check=True)
+            streams = json.loads(result.stdout).get("streams")
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            return None
+        return streams[0] if streams else None
+    
+    def _concat_without_reencoding(self, video_clips, video_dir, concat_output):
+        """Join clips that match the Shorts spec and share codec parameters with the concat demuxer and stream copy."""
+        clips_list_path = _write_concat_list(video_clips, f"{video_dir}/clips_list.txt")
+        
+        try:
+            _run_ffmpeg([
+                "ffmpeg", "-y", "-f", "concat", "-safe", "0",
+                "-i", clips_list_path, "-map", "0:v:0", "-c", "copy", concat_output
+            ], check=True)
+        except subprocess.CalledProcessError as e:
+            print("Joining clips without re-encoding failed:")
+            print(e.stderr.decode())
+            return False
+        
+        return os.path.exists(concat_output)
+    
+    def _standardize_with_concat_demuxer(self, video_clips, video_dir, concat_output):
+        """
+        Decode the clips back to back through the concat demuxer and standardize them with one filter chain.
+        
+        Only one decoder is open at a time, but the demuxer expects similar inputs, so
+        this is tried after the filter_complex pass rather than instead of it.
+        
+        Args:
+            video_clips (list): Paths of the downloaded clips
+            video_dir (str): Directory for the clip list
+            concat_output (str): Path of the joined video
             
-            # 2. Create a temporary extended video file
-            temp_dir = "temp_files"
-            os.makedirs(temp_dir, exist_ok=True)
+        Returns:
+            bool: True if the joined video was written
+        """
+        clips_list_path = _write_concat_list(video_clips, f"{video_dir}/all_clips.txt")
+        
+        try:
+            print(f"Standardizing {len(video_clips)} clips through the concat demuxer...")
+            _run_ffmpeg([
+                "ffmpeg", "-y", "-f", "concat", "-safe", "0",
+                "-i", clips_list_path,
+                "-map", "0:v:0",
+                "-vf", _STANDARD_FRAME_FILTER,
+                *_h264_encoder_args(),
+                concat_output
+            ], check=True)
+        except subprocess.CalledProcessError as e:
+            print("Concat demuxer standardization failed:")
+            print(e.stderr.decode())
+            return False
+        
+        return os.path.exists(concat_output)
+    
+    def _standardize_clips_separately(self, video_clips, video_dir, concat_output):
+        """
+        Standardize each clip in its own FFmpeg run, then concatenate them (slower fallback path).
+        
+        Args:
+            video_clips (list): Paths of the downloaded clips
+            video_dir (str): Directory for the intermediate files
+            concat_output (str): Path of the joined video
             
-            temp_extended = os.path.join(temp_dir, "temp_extended.mp4")
+        Returns:
+            bool: True if the joined video was written
+        """
+        # Standardize all clips to vertical format for Shorts; each clip is its own
+        # FFmpeg process, so run several at once and split the cores between them
+        cpu_count = os.cpu_count() or 1
+        workers = max(1, min(cpu_count, len(video_clips)))
+        threads = max(1, cpu_count // workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda item: self._standardize_clip(item[1], item[0], len(video_clips), video_dir, threads),
+                enumerate(video_clips)
+            )
+            results = [(std_clip, encoder) for std_clip, encoder in results if std_clip]
+        standardized_clips = [std_clip for std_clip, _ in results]
+        
+        if not standardized_clips:
+            print("No clips could be standardized for Shorts format. Aborting.")
+            return False
+        
+        if len(standardized_clips) == 1:
+            # Nothing to join; the standardized clip becomes the joined video
+            os.replace(standardized_clips[0], concat_output)
+            return True
             
-            # Loop the video to be longer than the audio
-            loops_needed = max(1, int(audio_duration / 15) + 1)  # Assume 15s original video
+        # Concatenate the standardized clips into one video
+        # Create a file list for FFmpeg's concat demuxer
+        clips_list_path = _write_concat_list(standardized_clips, f"{video_dir}/clips_list.txt")
+        
+        # Method 1: Use concat demuxer with stream copy. A copied MP4 keeps only the first
+        # clip's codec parameters, so this is only safe when every clip came out of the
+        # same encoder with the same settings
+        concat_success = False
+        if len({encoder for _, encoder in results}) == 1:
+            try:
+                print("Running FFmpeg to concatenate clips (Method 1)...")
+                _run_ffmpeg([
+                    "ffmpeg", "-y", "-f", "concat", "-safe", "0", 
+                    "-i", clips_list_path, "-c", "copy",
+                    "-movflags", "+faststart", concat_output
+                ], check=True)
+                concat_success = True
+            except subprocess.CalledProcessError as e:
+                print("Method 1 failed. Trying Method 2...")
+                print(e.stderr.decode())
+        else:
+            print("Clips were encoded with different settings; concatenating with Method 2...")
+        
+        if not concat_success:
+            # Method 2: Use filtergraph (slower, but more reliable)
+            try:
+                # Build the complex filtergraph
+                filter_parts = []
+                for i in range(len(standardized_clips)):
+                    filter_parts.append(f"[{i}:v]")
+                
+                filter_complex = "".join(filter_parts) + f"concat=n={len(standardized_clips)}:v=1:a=0[outv]"
+                
+                # Build the input arguments
+                input_args = []
+                for clip in standardized_clips:
+                    input_args.extend(["-i", clip])
+                
+                # Run FFmpeg with the complex filter
+                _run_ffmpeg(
+                    ["ffmpeg", "-y"] + input_args + [
+                        "-filter_complex", filter_complex, 
+                        "-map", "[outv]", 
+                        *_h264_encoder_args(),
+                        "-pix_fmt", "yuv420p", 
+                        concat_output
+                    ], check=True
+                )
+                concat_success = True
+            except subprocess.CalledProcessError as e:
+                print("Method 2 failed as well")
+                print(e.stderr.decode())
+                return False
+        
+        if not concat_success or not os.path.exists(concat_output):
+            print("Failed to concatenate clips. Aborting.")
+            return False
+        
+        return True
+    
+    def _standardize_clip(self, clip, i, total, video_dir, threads=0):
+        """
+        Scale and pad one clip to the vertical Shorts format.
+        
+        Every clip is re-encoded, even one that already matches, so that clips produced
+        with the same encoder settings can be joined with a stream copy afterwards.
+        
+        Args:
+            clip (str): Path of the downloaded clip
+            i (int): Position of the clip
+            total (int): Number of clips
+            video_dir (str): Directory for the standardized clip
+            threads (int): Encoder threads for this clip (0 lets FFmpeg decide)
             
-            subprocess.run([
-                "ffmpeg", "-y",
-                "-stream_loop", str(loops_needed),
-                "-i", video_path,
-                "-c:v", "libx264",  # Re-encode for reliability
-                "-t", str(audio_duration + 2),  # Add buffer
-                "-vf", "scale=720:1280:force_original_aspect_ratio=decrease,pad=720:1280:(ow-iw)/2:(oh-ih)/2",  # Force vertical format for Shorts
-                temp_extended
-            ], capture_output=True, check=True)
-            
-            # 3. Now combine with audio
-            subprocess.run([
+        Returns:
+            tuple: (path of the standardized clip, encoder arguments used), or
+                (None, None) if every conversion failed
+        """
+        std_clip = f"{video_dir}/std_clip_{i}.mp4"
+        print(f"Standardizing clip {i+1}/{total} for Shorts...")
+        
+        encoder = _h264_encoder_args()
+        try:
+            # For Shorts, we need vertical format (9:16 aspect ratio)
+            # Use 720x1280 as the standard vertical resolution for Shorts
+            _run_ffmpeg([
+                "ffmpeg", "-y", "-i", clip, 
+                "-vf", _STANDARD_FRAME_FILTER,
+                *encoder,
+                "-threads", str(threads),
+                # Matching timescales let the concat demuxer join clips without re-encoding
+                "-video_track_timescale", _SHORTS_TIMESCALE,
+                "-pix_fmt", "yuv420p", std_clip
+            ], check=True)
+            
+            return std_clip, encoder
+        except subprocess.CalledProcessError as e:
+            print(f"Error standardizing clip {i+1}:")
+            print(e.stderr.decode())
+            # Try a simpler conversion as fallback
+            try:
+                # Simpler approach that at least ensures vertical orientation
+                _run_ffmpeg([
+                    "ffmpeg", "-y", "-i", clip, 
+                    "-vf", _STANDARD_FRAME_FILTER,
+                    *_X264_ARGS, "-threads", str(threads),
+                    "-video_track_timescale", _SHORTS_TIMESCALE, std_clip
+                ], check=True)
+                return std_clip, _X264_ARGS
+            except subprocess.CalledProcessError as e:
+                print(f"Fallback conversion also failed for clip {i+1}")
+                print(e.stderr.decode())
+                return None, None
+    
+    def _alternate_shorts_video_assembly(self, video_path, audio_path, output_path, scratch_dir):
+        """Alternative video assembly method for Shorts as a fallback (scratch_dir holds its loop list)."""
+        print("Using alternate Shorts video assembly method...")
+        
+        try:
+            # 1. First, get audio duration (max 60 seconds for Shorts)
+            audio_duration = self._probe_duration(audio_path)
+            if audio_duration is None:
+                audio_duration = 60  # Default to max Shorts duration
+            audio_duration = min(audio_duration, 60)  # Cap at 60 seconds for Shorts
+            
+            # 2. Loop the video to be longer than the audio
+            video_duration = self._probe_duration(video_path) or 15  # Assume 15s if unknown
+            loops_needed = max(1, int(audio_duration / video_duration) + 1)
+            
+            stream = self._probe_video_stream(video_path)
+            if _is_shorts_stream(stream) and loops_needed == 1:
+                # One pass of the video covers the audio, so it can be copied straight in
+                video_input = ["-i", video_path]
+                video_codec = ["-c:v", "copy"]
+            elif _is_shorts_stream(stream):
+                # Already vertical H.264, so repeat it with the concat demuxer and copy the stream
+                loop_list_path = _write_concat_list(
+                    [video_path] * loops_needed, os.path.join(scratch_dir, "loop_list.txt")
+                )
+                video_input = ["-f", "concat", "-safe", "0", "-i", loop_list_path]
+                video_codec = ["-c:v", "copy"]
+            else:
+                video_input = ["-stream_loop", str(loops_needed), "-i", video_path]
+                video_codec = [*_h264_encoder_args(), "-pix_fmt", "yuv420p"]  # Re-encode for reliability
+                if not _has_shorts_size(stream):
+                    # The clips were already scaled to the Shorts frame; only redo it if they weren't
+                    video_codec += ["-vf", _VERTICAL_FILTER]
+            
+            # 3. Combine the looped video with the audio in the same pass
+            _run_ffmpeg([
                 "ffmpeg", "-y",
-                "-i", temp_extended,
+                *video_input,
                 "-i", audio_path,
-                "-c:v", "libx264",
+                *video_codec,
                 "-c:a", "aac",
                 "-map", "0:v:0",
                 "-map", "1:a:0",
                 "-shortest",
                 "-t", str(audio_duration),  # Ensure max 60 seconds for Shorts
                 output_path
-            ], capture_output=True, check=True)
-            
-            # Clean up temp files
-            if os.path.exists(temp_extended):
-                os.remove(temp_extended)
+            ], check=True)
             
             # Verify the output
             if os.path.exists(output_path) and os.path.getsize(output_path) > 10000:
@@ -2221,75 +2980,70 @@ class YouTubeShortsAutomationSystem:
             
     def _create_diagnostic_report(self, audio_file, video_clips, idea_title):
         """Create a diagnostic report for troubleshooting."""
+        import sys
+        
         try:
             report_path = f"diagnostic_report_{idea_title.replace(' ', '_')}.txt"
-            with open(report_path, 'w') as f:
-                f.write(f"=== DIAGNOSTIC REPORT FOR {idea_title} (SHORTS) ===\n\n")
-                
-                # System information
-                f.write("System Information:\n")
-                f.write(f"Python version: {sys.version}\n")
-                f.write(f"Current directory: {os.getcwd()}\n\n")
-                
-                # API keys status (without showing the actual keys)
-                f.write("API Keys Status:\n")
-                for key_name, key_value in self.api_keys.items():
-                    status = "Available" if key_value else "Missing"
-                    f.write(f"{key_name}: {status}\n")
-                f.write("\n")
-                
-                # Shorts config information
-                f.write("Shorts Configuration:\n")
-                f.write(f"shorts_mode: {self.config.get('shorts_mode', False)}\n")
-                shorts_settings = self.config.get('shorts_settings', {})
-                for key, value in shorts_settings.items():
-                    f.write(f"{key}: {value}\n")
-                f.write("\n")
-                
-                # Audio file information
-                f.write("Audio File Information:\n")
-                f.write(f"Path: {audio_file}\n")
-                if os.path.exists(audio_file):
-                    f.write(f"Size: {os.path.getsize(audio_file)} bytes\n")
-                    f.write(f"Last modified: {datetime.fromtimestamp(os.path.getmtime(audio_file))}\n")
+            
+            # Build the report in memory and write it in one go
+            report = io.StringIO()
+            report.write(f"=== DIAGNOSTIC REPORT FOR {idea_title} (SHORTS) ===\n\n")
+            
+            # System information
+            report.write("System Information:\n")
+            report.write(f"Python version: {sys.version}\n")
+            report.write(f"Current directory: {os.getcwd()}\n\n")
+            
+            # API keys status (without showing the actual keys)
+            report.write("API Keys Status:\n")
+            report.write("".join(
+                f"{key_name}: {'Available' if key_value else 'Missing'}\n"
+                for key_name, key_value in self.api_keys.items()
+            ) + "\n")
+            
+            # Shorts config information
+            report.write("Shorts Configuration:\n")
+            report.write(f"shorts_mode: {self.config.get('shorts_mode', False)}\n")
+            shorts_settings = self.config.get('shorts_settings', {})
+            report.write("".join(f"{key}: {value}\n" for key, value in shorts_settings.items()) + "\n")
+            
+            # Audio file information
+            report.write("Audio File Information:\n")
+            report.write(f"Path: {audio_file}\n")
+            report.write(_describe_file(audio_file, ""))
+            report.write("\n")
+            
+            # Video clips information
+            report.write(f"Video Clips Information ({len(video_clips)} clips):\n")
+            for i, clip in enumerate(video_clips):
+                report.write(f"Clip {i+1}: {clip}\n")
+                report.write(_describe_file(clip, "  "))
+            report.write("\n")
+            
+            # Directories information
+            report.write("Directories Information:\n")
+            report.write("".join(
+                f"{dir_name}: {dir_path} ({'exists' if os.path.exists(dir_path) else 'does not exist'})\n"
+                for dir_name, dir_path in self.config["directories"].items()
+            ) + "\n")
+            
+            # Try to get FFmpeg version
+            report.write("FFmpeg Information:\n")
+            try:
+                result = _run_ffmpeg(["ffmpeg", "-version"], capture_output=True, text=True)
+                if result.returncode == 0:
+                    report.write(f"Version: {result.stdout.splitlines()[0]}\n")
                 else:
-                    f.write("ERROR: File does not exist\n")
-                f.write("\n")
-                
-                # Video clips information
-                f.write(f"Video Clips Information ({len(video_clips)} clips):\n")
-                for i, clip in enumerate(video_clips):
-                    f.write(f"Clip {i+1}: {clip}\n")
-                    if os.path.exists(clip):
-                        f.write(f"  Size: {os.path.getsize(clip)} bytes\n")
-                        f.write(f"  Last modified: {datetime.fromtimestamp(os.path.getmtime(clip))}\n")
-                    else:
-                        f.write("  ERROR: File does not exist\n")
-                f.write("\n")
-                
-                # Directories information
-                f.write("Directories Information:\n")
-                for dir_name, dir_path in self.config["directories"].items():
-                    f.write(f"{dir_name}: {dir_path}")
-                    if os.path.exists(dir_path):
-                        f.write(" (exists)\n")
-                    else:
-                        f.write(" (does not exist)\n")
-                f.write("\n")
-                
-                # Try to get FFmpeg version
-                f.write("FFmpeg Information:\n")
-                try:
-                    result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        f.write(f"Version: {result.stdout.splitlines()[0]}\n")
-                    else:
-                        f.write("Error checking FFmpeg version\n")
-                except:
-                    f.write("FFmpeg not found in PATH\n")
-                f.write("\n")
-                
-                f.write("=== END OF REPORT ===\n")
+                    report.write("Error checking FFmpeg version\n")
+            except:
+                report.write("FFmpeg not found in PATH\n")
+            report.write("\n")
+            
+            report.write("=== END OF REPORT ===\n")
+            
+            # Write the whole report at once
+            with open(report_path, 'w') as f:
+                f.write(report.getvalue())
             
             print(f"Diagnostic report created at {report_path}")
             
@@ -2362,14 +3116,15 @@ class YouTubeShortsAutomationSystem:
         
         # Add topic-specific hashtags
         if isinstance(idea["keywords"], list) and idea["keywords"]:
-            topic_hashtags = " ".join([f"#{keyword.replace(' ', '')}" for keyword in idea["keywords"][:5] if keyword.lower() not in ["shorts", "youtubeshorts", "shortvideo"]])
+            topic_hashtags = " ".join([f"#{keyword.replace(' ', '')}" for keyword in idea["keywords"][:5] if keyword.lower() not in _GENERIC_SHORTS_TAGS])
             description += topic_hashtags
         
         # Convert keywords to tags, ensuring "shorts" is included
         tags = idea["keywords"] if isinstance(idea["keywords"], list) else []
-        if "shorts" not in [t.lower() for t in tags]:
+        tags_lc = {t.lower() for t in tags}
+        if "shorts" not in tags_lc:
             tags.append("shorts")
-        if "youtubeshorts" not in [t.lower() for t in tags]:
+        if "youtubeshorts" not in tags_lc:
             tags.append("YouTubeShorts")
         
         # Choose a privacy status (private, unlisted, or public)
@@ -2381,11 +3136,13 @@ class YouTubeShortsAutomationSystem:
         for attempt in range(max_attempts):
             try:
                 print(f"Uploading Shorts video: {title} (attempt {attempt+1})")
-                video_id = uploader.upload_video(
+                # Upload the video and set the custom thumbnail if there is one
+                video_id = uploader.publish_video(
                     video_file=video_path,
                     title=title,
                     description=description,
                     tags=tags,
+                    thumbnail_file=thumbnail_path if thumbnail_path and os.path.exists(thumbnail_path) else None,
                     privacy_status=privacy_status
                 )
                 
@@ -2400,13 +3157,6 @@ class YouTubeShortsAutomationSystem:
                         self._record_video_data(idea, "local_only", "local")
                         return None
                 
-                # Upload thumbnail if available
-                if thumbnail_path and os.path.exists(thumbnail_path):
-                    print("Setting custom thumbnail...")
-                    thumbnail_success = uploader.update_thumbnail(video_id, thumbnail_path)
-                    if not thumbnail_success:
-                        print("Warning: Failed to set custom thumbnail, but video was uploaded successfully.")
-                
                 # Print video URL
                 video_url = f"https://www.youtube.com/shorts/{video_id}"
                 print(f"Shorts video uploaded successfully: {video_url}")
@@ -2428,6 +3178,62 @@ class YouTubeShortsAutomationSystem:
     
     # ======== SHORTS AUTOMATION PIPELINE ========
     
+    def _gather_stock_footage(self, idea, niche):
+        """
+        Search for vertical stock footage matching an idea and download the clips.
+        
+        Args:
+            idea (dict): The selected content idea
+            niche (str): The content niche, used for broader searches
+            
+        Returns:
+            list: Paths of the downloaded clips
+        """
+        search_terms = [idea['title']] + idea['key_points'] + idea['keywords']
+        all_video_urls = []
+        
+        # For Shorts, prioritize vertical format; search the first 3 terms at once
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            for urls in executor.map(lambda term: self.search_stock_footage(term, per_page=3, vertical=True),
+                                     search_terms[:3]):
+                if urls:
+                    all_video_urls.extend(urls)
+        
+        # If we didn't get enough footage, try broader terms
+        if len(all_video_urls) < 3:
+            print("Not enough vertical stock footage found. Trying broader terms...")
+            broader_terms = [niche, "social media", "vertical video", "shorts"]
+            for term in broader_terms:
+                if len(all_video_urls) >= 6:  # We have enough now
+                    break
+                urls = self.search_stock_footage(term, per_page=3, vertical=True)
+                if urls:
+                    all_video_urls.extend(urls)
+        
+        return self.download_stock_footage(all_video_urls, idea['title'])
+    
+    def _generate_narration_with_retry(self, script_data, voice_id=None):
+        """Generate the voice narration, retrying up to the configured number of attempts."""
+        audio_file = None
+        max_audio_attempts = self.config.get("api_settings", {}).get("retry_attempts", 3)
+        for attempt in range(max_audio_attempts):
+            audio_file = self.generate_voice_narration(script_data, voice_id)
+            if audio_file:
+                break
+            print(f"Voice narration attempt {attempt+1} failed. Retrying...")
+        return audio_file
+    
+    def _create_thumbnail_with_retry(self, idea):
+        """Create the Shorts thumbnail, retrying up to the configured number of attempts."""
+        thumbnail_path = None
+        max_thumbnail_attempts = self.config.get("api_settings", {}).get("retry_attempts", 3)
+        for attempt in range(max_thumbnail_attempts):
+            thumbnail_path = self.create_thumbnail(idea)
+            if thumbnail_path:
+                break
+            print(f"Thumbnail creation attempt {attempt+1} failed. Retrying...")
+        return thumbnail_path
+    
     def run_full_automation(self, niche, voice_id=None):
         """Run the full automation pipeline for YouTube Shorts with enhanced resilience."""
         print(f"Starting Shorts automation for niche: {niche}")
@@ -2442,12 +3248,7 @@ class YouTubeShortsAutomationSystem:
         # Force shorts mode to be true (this is a Shorts-only system)
         self.config["shorts_mode"] = True
         if "shorts_settings" not in self.config:
-            self.config["shorts_settings"] = {
-                "enabled": True,
-                "max_duration": 60,
-                "vertical_format": True,
-                "fast_paced": True
-            }
+            self.config["shorts_settings"] = dict(_SHORTS_DEFAULTS)
         else:
             self.config["shorts_settings"]["enabled"] = True
         
@@ -2460,6 +3261,7 @@ class YouTubeShortsAutomationSystem:
         # Select the best idea (not just random)
         idea = self._select_best_idea(ideas, niche)
         print(f"Selected Shorts idea: {idea['title']}")
+        self._remember_idea(idea, niche)
         
         # Step 2: Generate script optimized for Shorts
         script_data = None
@@ -2474,50 +3276,21 @@ class YouTubeShortsAutomationSystem:
             print("Failed to generate Shorts script after multiple attempts. Aborting.")
             return
         
-        # Step 3: Generate voice narration with retry
-        audio_file = None
-        max_audio_attempts = self.config.get("api_settings", {}).get("retry_attempts", 3)
-        for attempt in range(max_audio_attempts):
-            audio_file = self.generate_voice_narration(script_data, voice_id)
-            if audio_file:
-                break
-            print(f"Voice narration attempt {attempt+1} failed. Retrying...")
-        
-        # Step 4: Search and download vertical stock footage with quality monitoring
-        search_terms = [idea['title']] + idea['key_points'] + idea['keywords']
-        all_video_urls = []
+        # Steps 3 to 5: Generate the voice narration, fetch stock footage and create the
+        # thumbnail concurrently, since none depends on another and all of them spend
+        # most of their time waiting on the network
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            audio_future = executor.submit(self._generate_narration_with_retry, script_data, voice_id)
+            footage_future = executor.submit(self._gather_stock_footage, idea, niche)
+            thumbnail_future = executor.submit(self._create_thumbnail_with_retry, idea)
+            audio_file = audio_future.result()
+            video_clips = footage_future.result()
+            thumbnail_path = thumbnail_future.result()
         
-        # For Shorts, prioritize vertical format
-        for term in search_terms[:3]:  # Limit to first 3 terms
-            urls = self.search_stock_footage(term, per_page=3, vertical=True)
-            if urls:
-                all_video_urls.extend(urls)
-        
-        # If we didn't get enough footage, try broader terms
-        if len(all_video_urls) < 3:
-            print("Not enough vertical stock footage found. Trying broader terms...")
-            broader_terms = [niche, "social media", "vertical video", "shorts"]
-            for term in broader_terms:
-                if len(all_video_urls) >= 6:  # We have enough now
-                    break
-                urls = self.search_stock_footage(term, per_page=3, vertical=True)
-                if urls:
-                    all_video_urls.extend(urls)
-        
-        video_clips = self.download_stock_footage(all_video_urls, idea['title'])
         if not video_clips:
             print("Failed to download stock footage. Aborting.")
             return
         
-        # Step 5: Create thumbnail optimized for Shorts with retry
-        thumbnail_path = None
-        max_thumbnail_attempts = self.config.get("api_settings", {}).get("retry_attempts", 3)
-        for attempt in range(max_thumbnail_attempts):
-            thumbnail_path = self.create_thumbnail(idea)
-            if thumbnail_path:
-                break
-            print(f"Thumbnail creation attempt {attempt+1} failed. Retrying...")
-        
         # Step 6: Assemble Shorts video
         final_video = self.assemble_shorts_video(audio_file, video_clips, idea['title'])
         if not final_video:
@@ -7,16 +7,250 @@ advanced error handling and retry logic.
 """
 
 import os
+import asyncio
+import email.utils
+import hashlib
+import mimetypes
 import pickle
+import queue
+import threading
 import time
 import json
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
+from functools import lru_cache
+import httplib2
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson  # Optional: faster API request and response (de)serialization
+except ImportError:
+    orjson = None
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that encodes request bodies and decodes responses with orjson."""
+    
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            body_value = {"data": body_value}
+        return orjson.dumps(body_value).decode("utf-8")
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+# Model for API clients (None keeps the library's stdlib json model)
+_JSON_MODEL = _OrjsonModel() if orjson else None
+
+# Socket timeout in seconds for YouTube API connections
+_HTTP_TIMEOUT = 30
+
+# Statuses the API uses to push back when it is being called too fast
+_OVERLOAD_STATUS_CODES = frozenset({429, 503})
+
+# Most video IDs a single videos.list request accepts
+_MAX_IDS_PER_LIST = 50
+
+# Statuses worth retrying an upload chunk for: server errors and rate limits
+_RETRIABLE_STATUS_CODES = frozenset({500, 502, 503, 504, 429})
+
+class _AdaptiveLimiter:
+    """
+    Concurrency limit for YouTube API calls that adapts to server pushback.
+    
+    The limit grows by one after every `increase_after` successful calls and is halved
+    whenever the API answers 429 or 503 (additive increase, multiplicative decrease),
+    so parallel uploads settle near what the quota allows instead of bursting into
+    errors and all backing off at once.
+    """
+    
+    def __init__(self, max_concurrency=8, min_concurrency=1, increase_after=10):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.increase_after = increase_after
+        self.limit = max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+    
+    @contextmanager
+    def slot(self):
+        """Hold one of the allowed concurrent calls for the duration of the block."""
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        
+        overloaded = succeeded = False
+        try:
+            yield
+            succeeded = True
+        except HttpError as e:
+            overloaded = e.resp.status in _OVERLOAD_STATUS_CODES
+            raise
+        finally:
+            with self._cond:
+                self._active -= 1
+                if overloaded:
+                    self.limit = max(self.min_concurrency, self.limit // 2)
+                    self._successes = 0
+                    print(f"YouTube API pushed back; allowing {self.limit} concurrent calls")
+                elif succeeded:
+                    self._successes += 1
+                    if self._successes >= self.increase_after and self.limit < self.max_concurrency:
+                        self.limit += 1
+                        self._successes = 0
+                self._cond.notify_all()
+
+# Shared by every uploader in the process, since they all draw on the same quota
+_API_LIMITER = _AdaptiveLimiter()
+
+# Size of each resumable upload request (must be a multiple of 256 KB)
+_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Chunk buffers returned by finished uploads, for the next upload to reuse
+_CHUNK_BUFFERS = queue.SimpleQueue()
+
+class PooledMediaUpload(MediaIoBaseUpload):
+    """
+    Resumable file upload that reads every chunk into one reused buffer.
+    
+    MediaFileUpload allocates a new bytes object for each chunk it sends; this reads
+    each chunk into a buffer taken from a shared pool and returned when the upload is
+    closed, so concurrent uploads each hold one buffer for their whole run.
+    """
+    
+    def __init__(self, filename, mimetype, chunksize=_UPLOAD_CHUNK_SIZE):
+        self._file = open(filename, "rb", buffering=0)
+        super().__init__(self._file, mimetype, chunksize=chunksize, resumable=True)
+        try:
+            self._buffer = _CHUNK_BUFFERS.get_nowait()
+        except queue.Empty:
+            self._buffer = None
+        if self._buffer is None or len(self._buffer) < chunksize:
+            self._buffer = bytearray(chunksize)
+    
+    def has_stream(self):
+        """Report no stream, so the client requests each chunk through getbytes."""
+        return False
+    
+    def getbytes(self, begin, length):
+        """Read length bytes from begin into the buffer and return a view of them."""
+        view = memoryview(self._buffer)[:length]
+        self._file.seek(begin)
+        filled = 0
+        while filled < length:
+            count = self._file.readinto(view[filled:])
+            if not count:
+                break
+            filled += count
+        return view[:filled]
+    
+    def close(self):
+        """Close the file and give the buffer back to the pool."""
+        if not self._file.closed:
+            self._file.close()
+            _CHUNK_BUFFERS.put(self._buffer)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+# OAuth credentials shared between uploader instances, keyed by client secrets and token
+# file, and reused for 55 minutes (access tokens last an hour)
+_CRED_CACHE = {}
+_CRED_CACHE_LOCK = threading.Lock()
+_CRED_CACHE_TTL = 55 * 60
+
+def _read_client_secrets(client_secrets_file):
+    """Read the client secrets file, returning (parsed secrets, SHA-1 of the contents), or (None, None)."""
+    try:
+        with open(client_secrets_file, "rb") as f:
+            raw = f.read()
+        return json.loads(raw), hashlib.sha1(raw).hexdigest()
+    except (OSError, ValueError):
+        return None, None
+
+@lru_cache(maxsize=None)
+def _discovery_document(service_name, version):
+    """Return the API's discovery document bundled with the client library (read once per process), or None."""
+    return get_static_doc(service_name, version)
+
+def _retry_after_seconds(resp):
+    """Return the wait requested by a response's Retry-After header in seconds, or None if it has none."""
+    value = resp.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)  # The header may also be an HTTP date
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+def _execute(request):
+    """Execute an API request within the shared concurrency limit."""
+    with _API_LIMITER.slot():
+        return request.execute()
+
+def _normalize_tags(tags):
+    """Turn a comma-separated string or any iterable of tags into a tuple of stripped tags."""
+    if isinstance(tags, str):
+        tags = tags.split(',')
+    return tuple(tag.strip() for tag in tags if tag.strip())
+
+def _build_body(title, description, tags, category, privacy_status, notify_subscribers):
+    """
+    Build the videos.insert request body.
+    
+    Args:
+        title: Video title (truncated to YouTube's 100 character limit)
+        description: Video description
+        tags: Sequence of tags, already normalized
+        category: YouTube category ID
+        privacy_status: private, public, or unlisted
+        notify_subscribers: Whether to notify subscribers (only used for public videos)
+        
+    Returns:
+        Request body dict with "snippet" and "status" parts
+    """
+    body = {
+        "snippet": {
+            "title": (title[:97] + "...") if len(title) > 100 else title,
+            "description": description,
+            "tags": tags,
+            "categoryId": category
+        },
+        "status": {
+            "privacyStatus": privacy_status,
+            "selfDeclaredMadeForKids": False,
+            "publishAt": None  # Set a date to schedule, or None for immediate
+        }
+    }
+    
+    # If public and notify_subscribers is False, add notifySubscribers property
+    if privacy_status == "public" and not notify_subscribers:
+        body["status"]["notifySubscribers"] = False
+    return body
 
 class YouTubeUploader:
     def __init__(self, client_secrets_file="client_secrets.json", token_pickle_file="token.pickle"):
@@ -33,14 +267,62 @@ class YouTubeUploader:
         self.api_version = "v3"
         self.scopes = ["https://www.googleapis.com/auth/youtube.upload", 
                        "https://www.googleapis.com/auth/youtube.readonly"]
-        self.youtube = None
+        self._credentials = None
+        # Parse the client secrets once; their hash keys the shared credential cache, so
+        # rotated secrets aren't matched with old tokens
+        self._client_secrets, secrets_id = _read_client_secrets(client_secrets_file)
+        self._cred_cache_key = (
+            secrets_id or os.path.abspath(client_secrets_file), os.path.abspath(token_pickle_file)
+        )
+        self._local = threading.local()
+        self._auth_lock = threading.Lock()
+    
+    @property
+    def youtube(self):
+        """
+        The YouTube API client for the calling thread.
+        
+        httplib2 connections can't be shared between threads, so each thread gets its
+        own client, built from the shared credentials the first time it is needed.
+        """
+        service = getattr(self._local, "youtube", None)
+        if service is None and self._credentials is not None:
+            try:
+                service = self._local.youtube = self._build_service(self._credentials)
+            except Exception as e:
+                print(f"Error building YouTube API client: {str(e)}")
+        return service
+    
+    @youtube.setter
+    def youtube(self, service):
+        self._local.youtube = service
         
+    def _build_service(self, credentials):
+        """Build an API client whose requests all go through one authorized, kept-alive HTTP connection."""
+        http = AuthorizedHttp(credentials, http=httplib2.Http(timeout=_HTTP_TIMEOUT))
+        document = _discovery_document(self.api_service_name, self.api_version)
+        if document is not None:
+            return build_from_document(document, http=http, model=_JSON_MODEL)
+        return build(self.api_service_name, self.api_version, http=http, cache_discovery=False, model=_JSON_MODEL)
+    
     def authenticate(self):
         """Handle OAuth authentication flow with improved error handling."""
+        # Only one thread at a time may load, refresh or request the credentials
+        with self._auth_lock:
+            return self._authenticate()
+    
+    def _authenticate(self):
+        """Load, refresh or request the OAuth credentials and build the API client."""
         credentials = None
         
+        # Reuse credentials another uploader loaded recently, if they are still valid
+        with _CRED_CACHE_LOCK:
+            cached, expires_at = _CRED_CACHE.get(self._cred_cache_key, (None, 0))
+        if cached is not None and time.time() < expires_at and cached.valid:
+            credentials = cached
+        
         # Try to load credentials from token pickle file
-        if os.path.exists(self.token_pickle_file):
+        elif os.path.exists(self.token_pickle_file):
             try:
                 print("Loading credentials from file...")
                 with open(self.token_pickle_file, "rb") as token:
@@ -57,26 +339,23 @@ class YouTubeUploader:
                     credentials.refresh(Request())
                 else:
                     print("Fetching new tokens...")
-                    if not os.path.exists(self.client_secrets_file):
-                        raise FileNotFoundError(f"OAuth client secrets file '{self.client_secrets_file}' not found.")
-                    
-                    # Read the client secrets file to check its format
-                    with open(self.client_secrets_file, 'r') as f:
-                        client_secrets = json.load(f)
+                    if self._client_secrets is None:
+                        # The file may have been added since the uploader was created
+                        self._client_secrets, _ = _read_client_secrets(self.client_secrets_file)
+                    if self._client_secrets is None:
+                        raise FileNotFoundError(
+                            f"OAuth client secrets file '{self.client_secrets_file}' not found or not valid JSON."
+                        )
                     
-                    # Check if it has a 'web' key (Google Cloud Console format)
-                    if 'web' in client_secrets:
+                    # Check if it has a 'web' key (Google Cloud Console format); both formats
+                    # are accepted by from_client_config
+                    if 'web' in self._client_secrets:
                         print("Using web application credentials format")
-                        # Use the web flow for authentication
-                        flow = InstalledAppFlow.from_client_config(
-                            client_secrets, self.scopes
-                        )
                     else:
                         print("Using standard client secrets format")
-                        # Use the standard client secrets file format
-                        flow = InstalledAppFlow.from_client_secrets_file(
-                            self.client_secrets_file, self.scopes
-                        )
+                    flow = InstalledAppFlow.from_client_config(
+                        self._client_secrets, self.scopes
+                    )
                     
                     # This will open a browser window for authentication
                     credentials = flow.run_local_server(port=8080)
@@ -88,11 +367,14 @@ class YouTubeUploader:
                 print(f"Authentication error: {str(e)}")
                 return False
         
+        if credentials is not cached:
+            with _CRED_CACHE_LOCK:
+                _CRED_CACHE[self._cred_cache_key] = (credentials, time.time() + _CRED_CACHE_TTL)
+        
         # Build the YouTube API client
         try:
-            self.youtube = build(
-                self.api_service_name, self.api_version, credentials=credentials
-            )
+            self.youtube = self._build_service(credentials)
+            self._credentials = credentials
             print("YouTube API client created successfully.")
             return True
         except Exception as e:
@@ -104,10 +386,10 @@ class YouTubeUploader:
         Upload a video to YouTube with enhanced error handling.
         
         Args:
-            video_file: Path to the video file to upload
+            video_file: Path to the video file to upload, or a seekable binary stream
             title: Video title
             description: Video description
-            tags: List of tags
+            tags: List or tuple of tags (see _normalize_tags for comma-separated strings)
             category: YouTube category ID (default is 22 for People & Blogs)
             privacy_status: private, public, or unlisted (default is private)
             notify_subscribers: Whether to notify subscribers (only works if privacy_status is "public")
@@ -115,9 +397,14 @@ class YouTubeUploader:
         Returns:
             YouTube video ID if successful, None otherwise
         """
-        if not os.path.exists(video_file):
-            print(f"Error: Video file '{video_file}' not found.")
-            return None
+        # One stat both checks that the file exists and gives its size
+        is_path = isinstance(video_file, (str, os.PathLike))
+        if is_path:
+            try:
+                file_size = os.stat(video_file).st_size
+            except OSError:
+                print(f"Error: Video file '{video_file}' not found.")
+                return None
             
         if not self.youtube:
             success = self.authenticate()
@@ -126,40 +413,17 @@ class YouTubeUploader:
                 return None
         
         try:
-            # Make sure tags is a list
-            if tags and not isinstance(tags, list):
-                if isinstance(tags, str):
-                    tags = [tag.strip() for tag in tags.split(',')]
-                else:
-                    tags = list(tags)
-            
-            # Ensure title isn't too long (YouTube limit is 100 characters)
-            if len(title) > 100:
-                title = title[:97] + "..."
-            
-            # Define video metadata
-            body = {
-                "snippet": {
-                    "title": title,
-                    "description": description,
-                    "tags": tags,
-                    "categoryId": category
-                },
-                "status": {
-                    "privacyStatus": privacy_status,
-                    "selfDeclaredMadeForKids": False,
-                    "publishAt": None  # Set a date to schedule, or None for immediate
-                }
-            }
-            
-            # If public and notify_subscribers is False, add notifySubscribers property
-            if privacy_status == "public" and not notify_subscribers:
-                body["status"]["notifySubscribers"] = False
+            body = _build_body(title, description, tags, category, privacy_status, notify_subscribers)
+            title = body["snippet"]["title"]
             
             # Create upload request
             print(f"Preparing to upload video: {title}")
-            print(f"File path: {video_file}")
-            file_size = os.path.getsize(video_file)
+            if is_path:
+                print(f"File path: {video_file}")
+            else:
+                # Measure the stream by seeking to its end (resumable uploads need to seek anyway)
+                file_size = video_file.seek(0, os.SEEK_END)
+                video_file.seek(0)
             print(f"File size: {file_size / (1024 * 1024):.2f} MB")
             
             # Validate video file
@@ -167,24 +431,24 @@ class YouTubeUploader:
                 print("Error: Video file is empty")
                 return None
                 
-            # Create a media upload object
-            media = MediaFileUpload(
-                video_file, 
-                mimetype="video/*",
-                chunksize=1024 * 1024 * 5,  # 5MB chunks
-                resumable=True
-            )
-            
-            # Create the API request
-            insert_request = self.youtube.videos().insert(
-                part=",".join(body.keys()),
-                body=body,
-                media_body=media
-            )
-            
-            # Execute upload with progress tracking and exponential backoff
-            print(f"Starting upload for '{title}'...")
-            video_id = self._resumable_upload(insert_request)
+            # Create a media upload object; streams are read directly, without a temporary file
+            if is_path:
+                media_upload = PooledMediaUpload(video_file, mimetype="video/*")
+            else:
+                media_upload = nullcontext(MediaIoBaseUpload(
+                    video_file, mimetype="video/*", chunksize=_UPLOAD_CHUNK_SIZE, resumable=True
+                ))
+            with media_upload as media:
+                # Create the API request
+                insert_request = self.youtube.videos().insert(
+                    part=",".join(body.keys()),
+                    body=body,
+                    media_body=media
+                )
+                
+                # Execute upload with progress tracking and exponential backoff
+                print(f"Starting upload for '{title}'...")
+                video_id = self._resumable_upload(insert_request)
             return video_id
             
         except HttpError as e:
@@ -194,6 +458,59 @@ class YouTubeUploader:
             print(f"An unexpected error occurred during upload: {str(e)}")
             return None
         
+    def publish_video(self, video_file, title, description, tags, thumbnail_file=None, **upload_kwargs):
+        """
+        Upload a video and set its custom thumbnail.
+        
+        Media uploads can't go in a batch request, and the thumbnail needs the new
+        video's ID, so these are two calls on the same authenticated client.
+        
+        Args:
+            video_file: Path to the video file to upload
+            title: Video title
+            description: Video description
+            tags: List of tags
+            thumbnail_file: Path to the thumbnail image (optional)
+            **upload_kwargs: Other upload_video arguments (category, privacy_status, ...)
+            
+        Returns:
+            YouTube video ID if the upload succeeded (even if the thumbnail failed), None otherwise
+        """
+        video_id = self.upload_video(video_file, title, description, tags, **upload_kwargs)
+        if video_id and thumbnail_file:
+            if not self.update_thumbnail(video_id, thumbnail_file):
+                print("Warning: Failed to set custom thumbnail, but video was uploaded successfully.")
+        return video_id
+    
+    def upload_many(self, jobs, max_workers=4):
+        """
+        Upload several videos in parallel worker threads.
+        
+        Uploads spend nearly all their time blocked on the network, so a few threads
+        (each with its own API client) keep several upload sessions moving at once.
+        
+        Args:
+            jobs: List of dicts of upload_video keyword arguments
+            max_workers: Maximum number of simultaneous uploads (default is 4)
+            
+        Returns:
+            List of YouTube video IDs in the same order as jobs (None for failed uploads)
+        """
+        # Authenticate once up front rather than racing every worker into the OAuth flow
+        if self._credentials is None and not self.authenticate():
+            print("Failed to authenticate with YouTube.")
+            return [None] * len(jobs)
+        
+        video_ids = [None] * len(jobs)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.upload_video, **job): index for index, job in enumerate(jobs)}
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                video_ids[index] = future.result()
+                status = "uploaded" if video_ids[index] else "failed"
+                print(f"[{done}/{len(jobs)}] {status}: {jobs[index].get('title', jobs[index].get('video_file'))}")
+        return video_ids
+    
     def _resumable_upload(self, request):
         """
         Implement resumable upload with progress tracking and exponential backoff.
@@ -214,31 +531,34 @@ class YouTubeUploader:
         sleep_multiplier = 2
         max_sleep = 60  # Maximum sleep time between retries (1 minute)
         
+        next_chunk = request.next_chunk
+        limiter_slot = _API_LIMITER.slot
         while response is None and retry <= max_retries:
             try:
                 print("Uploading video...")
-                status, response = request.next_chunk()
+                with limiter_slot():
+                    status, response = next_chunk()
                 if status:
                     percent = int(status.progress() * 100)
                     print(f"Upload progress: {percent}%")
-                    
-                    # Add occasional delay to avoid rate limits
-                    if random.random() < 0.2:  # 20% chance
-                        delay = random.uniform(0.5, 2.0)
-                        time.sleep(delay)
                         
             except HttpError as e:
-                if e.resp.status in [500, 502, 503, 504, 429]:  # Server errors or rate limits
+                if e.resp.status in _RETRIABLE_STATUS_CODES:
                     retry += 1
                     if retry > max_retries:
                         print(f"Too many retries ({retry-1}). Upload failed.")
                         error = e
                         break
                         
-                    # Calculate sleep time with exponential backoff and jitter
-                    sleep_time = min(sleep_seconds * (sleep_multiplier ** (retry - 1)), max_sleep)
-                    # Add jitter (±30%)
-                    sleep_time = sleep_time * random.uniform(0.7, 1.3)
+                    # Wait as long as the server asks (up to max_sleep); otherwise use
+                    # exponential backoff with jitter
+                    sleep_time = _retry_after_seconds(e.resp)
+                    if sleep_time is None:
+                        sleep_time = min(sleep_seconds * (sleep_multiplier ** (retry - 1)), max_sleep)
+                        # Add jitter (±30%)
+                        sleep_time = sleep_time * random.uniform(0.7, 1.3)
+                    else:
+                        sleep_time = min(sleep_time, max_sleep)
                     
                     print(f"Retrying upload in {sleep_time:.1f} seconds... (Attempt {retry}/{max_retries})")
                     time.sleep(sleep_time)
@@ -293,9 +613,13 @@ class YouTubeUploader:
         Returns:
             True if successful, False otherwise
         """
-        if not os.path.exists(thumbnail_file):
+        try:
+            thumbnail_size = os.stat(thumbnail_file).st_size
+        except OSError:
             print(f"Error: Thumbnail file '{thumbnail_file}' not found.")
             return False
+        if not thumbnail_size:
+            print("Warning: Thumbnail file appears to be empty")
             
         if not self.youtube:
             success = self.authenticate()
@@ -303,29 +627,28 @@ class YouTubeUploader:
                 print("Failed to authenticate with YouTube.")
                 return False
         
+        # Thumbnails are small, so send them in a single request rather than opening
+        # a resumable upload session first
+        try:
+            media = MediaFileUpload(
+                thumbnail_file,
+                mimetype=mimetypes.guess_type(thumbnail_file)[0] or 'image/jpeg',
+                resumable=False
+            )
+        except OSError as e:
+            print(f"Error reading thumbnail file: {str(e)}")
+            return False
+        
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
                 print(f"Setting thumbnail for video {video_id} using file {thumbnail_file}")
                 
-                # Verify the file can be read
-                with open(thumbnail_file, 'rb') as f:
-                    first_bytes = f.read(10)
-                    if not first_bytes:
-                        print("Warning: Thumbnail file appears to be empty")
-                
-                # Create the media upload object
-                media = MediaFileUpload(
-                    thumbnail_file,
-                    mimetype='image/png' if thumbnail_file.endswith('.png') else 'image/jpeg',
-                    resumable=True
-                )
-                
                 # Execute the request
-                self.youtube.thumbnails().set(
+                _execute(self.youtube.thumbnails().set(
                     videoId=video_id,
                     media_body=media
-                ).execute()
+                ))
                 
                 print(f"Thumbnail set for video {video_id}")
                 return True
@@ -359,10 +682,10 @@ class YouTubeUploader:
         
         try:
             # Get channel information for the authenticated user
-            response = self.youtube.channels().list(
+            response = _execute(self.youtube.channels().list(
                 part="snippet,statistics,contentDetails",
                 mine=True
-            ).execute()
+            ))
             
             if response and "items" in response and response["items"]:
                 channel = response["items"][0]
@@ -406,38 +729,54 @@ class YouTubeUploader:
         Returns:
             Dictionary with video statistics
         """
+        statistics = self.get_video_statistics_many([video_id])
+        if statistics is None:
+            return None
+        if video_id not in statistics:
+            print(f"No video found with ID {video_id}.")
+            return None
+        return statistics[video_id]
+    
+    def get_video_statistics_many(self, video_ids):
+        """
+        Get statistics for several videos, fetching up to 50 per request.
+        
+        Args:
+            video_ids: List of YouTube video IDs
+            
+        Returns:
+            Dictionary mapping each found video ID to its statistics, or None on error
+        """
         if not self.youtube:
             success = self.authenticate()
             if not success:
                 print("Failed to authenticate with YouTube.")
                 return None
         
+        results = {}
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         try:
-            # Get video information
-            response = self.youtube.videos().list(
-                part="statistics,snippet",
-                id=video_id
-            ).execute()
-            
-            if response and "items" in response and response["items"]:
-                video = response["items"][0]
-                
-                # Safely access nested properties
-                snippet = video.get("snippet", {})
-                statistics = video.get("statistics", {})
+            for start in range(0, len(video_ids), _MAX_IDS_PER_LIST):
+                # Get video information
+                response = _execute(self.youtube.videos().list(
+                    part="statistics,snippet",
+                    id=",".join(video_ids[start:start + _MAX_IDS_PER_LIST])
+                ))
                 
-                info = {
-                    "title": snippet.get("title", ""),
-                    "publishedAt": snippet.get("publishedAt", ""),
-                    "views": statistics.get("viewCount", "0"),
-                    "likes": statistics.get("likeCount", "0"),
-                    "comments": statistics.get("commentCount", "0"),
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-                return info
-            else:
-                print(f"No video found with ID {video_id}.")
-                return None
+                for video in (response or {}).get("items", []):
+                    # Safely access nested properties
+                    snippet = video.get("snippet", {})
+                    statistics = video.get("statistics", {})
+                    
+                    results[video.get("id", "")] = {
+                        "title": snippet.get("title", ""),
+                        "publishedAt": snippet.get("publishedAt", ""),
+                        "views": statistics.get("viewCount", "0"),
+                        "likes": statistics.get("likeCount", "0"),
+                        "comments": statistics.get("commentCount", "0"),
+                        "timestamp": timestamp
+                    }
+            return results
                 
         except HttpError as e:
             print(f"An error occurred while getting video statistics: {e}")
@@ -446,10 +785,15 @@ class YouTubeUploader:
             print(f"Unexpected error while getting video statistics: {str(e)}")
             return None
     
-    def update_video(self, video_id, title=None, description=None, tags=None, category=None, privacy=None):
+    def update_video(self, video_id, title=None, description=None, tags=None, category=None, privacy=None,
+                     snippet=None, status=None):
         """
         Update video metadata.
         
+        Only the parts that change are sent. Pass the full snippet and/or status you
+        want the video to have (e.g. the ones just uploaded) to skip fetching the
+        current ones first; the individual fields are applied on top of them.
+        
         Args:
             video_id: YouTube video ID
             title: New title (optional)
@@ -457,6 +801,8 @@ class YouTubeUploader:
             tags: New tags (optional)
             category: New category ID (optional)
             privacy: New privacy status (optional)
+            snippet: Complete target snippet (optional)
+            status: Complete target status (optional)
             
         Returns:
             True if successful, False otherwise
@@ -467,42 +813,44 @@ class YouTubeUploader:
                 print("Failed to authenticate with YouTube.")
                 return False
         
+        resources = {"snippet": snippet, "status": status}
+        changes = {
+            "snippet": {key: value for key, value in (
+                ("title", title), ("description", description), ("tags", tags), ("categoryId", category)
+            ) if value},
+            "status": {"privacyStatus": privacy} if privacy else {},
+        }
+        # Send the parts the caller supplied or changed (both if nothing was given, as before)
+        parts = [part for part in ("snippet", "status") if resources[part] is not None or changes[part]]
+        parts = parts or ["snippet", "status"]
+        
         try:
-            # First get the existing video details
-            response = self.youtube.videos().list(
-                part="snippet,status",
-                id=video_id
-            ).execute()
-            
-            if not response or "items" not in response or not response["items"]:
-                print(f"No video found with ID {video_id}.")
-                return False
-            
-            video = response["items"][0]
-            snippet = video["snippet"]
-            status = video["status"]
+            # Fetch the current values only for the parts the caller didn't supply
+            missing = [part for part in parts if resources[part] is None]
+            if missing:
+                response = _execute(self.youtube.videos().list(
+                    part=",".join(missing),
+                    id=video_id
+                ))
+                
+                if not response or "items" not in response or not response["items"]:
+                    print(f"No video found with ID {video_id}.")
+                    return False
+                
+                video = response["items"][0]
+                for part in missing:
+                    resources[part] = video[part]
             
             # Update fields if provided
-            if title:
-                snippet["title"] = title
-            if description:
-                snippet["description"] = description
-            if tags:
-                snippet["tags"] = tags
-            if category:
-                snippet["categoryId"] = category
-            if privacy:
-                status["privacyStatus"] = privacy
+            body = {"id": video_id}
+            for part in parts:
+                body[part] = {**resources[part], **changes[part]}
             
             # Update the video
-            update_response = self.youtube.videos().update(
-                part="snippet,status",
-                body={
-                    "id": video_id,
-                    "snippet": snippet,
-                    "status": status
-                }
-            ).execute()
+            _execute(self.youtube.videos().update(
+                part=",".join(parts),
+                body=body
+            ))
             
             print(f"Video {video_id} updated successfully.")
             return True
@@ -513,6 +861,55 @@ class YouTubeUploader:
         except Exception as e:
             print(f"Unexpected error while updating video: {str(e)}")
             return False
+    
+    # ======== ASYNC WRAPPERS ========
+    # The Google API client is synchronous, so these run each call in a worker thread
+    # (with its own API client) and let an event loop wait on several at once.
+    
+    async def upload_video_async(self, *args, **kwargs):
+        """Async version of upload_video."""
+        return await asyncio.to_thread(self.upload_video, *args, **kwargs)
+    
+    async def update_thumbnail_async(self, video_id, thumbnail_file):
+        """Async version of update_thumbnail."""
+        return await asyncio.to_thread(self.update_thumbnail, video_id, thumbnail_file)
+    
+    async def get_channel_info_async(self):
+        """Async version of get_channel_info."""
+        return await asyncio.to_thread(self.get_channel_info)
+    
+    async def get_video_statistics_async(self, video_id):
+        """Async version of get_video_statistics."""
+        return await asyncio.to_thread(self.get_video_statistics, video_id)
+    
+    async def get_video_statistics_many_async(self, video_ids):
+        """Async version of get_video_statistics_many."""
+        return await asyncio.to_thread(self.get_video_statistics_many, video_ids)
+    
+    async def publish_video_async(self, *args, **kwargs):
+        """Async version of publish_video."""
+        return await asyncio.to_thread(self.publish_video, *args, **kwargs)
+    
+    async def update_video_async(self, video_id, **kwargs):
+        """Async version of update_video."""
+        return await asyncio.to_thread(self.update_video, video_id, **kwargs)
+    
+    async def upload_many_async(self, videos):
+        """
+        Upload several videos concurrently.
+        
+        Args:
+            videos: List of dicts of upload_video keyword arguments
+            
+        Returns:
+            List of YouTube video IDs in the same order (None for failed uploads)
+        """
+        # Authenticate once up front rather than racing every upload into the OAuth flow
+        if self._credentials is None and not await asyncio.to_thread(self.authenticate):
+            print("Failed to authenticate with YouTube.")
+            return [None] * len(videos)
+        
+        return list(await asyncio.gather(*(self.upload_video_async(**video) for video in videos)))
             
 # Simple testing functionality
 if __name__ == "__main__":
@@ -547,24 +944,18 @@ if __name__ == "__main__":
     if args.upload:
         # Upload video
         print(f"Uploading {args.upload}...")
-        video_id = uploader.upload_video(
+        video_id = uploader.publish_video(
             args.upload,
             args.title,
             args.description,
-            args.tags.split(','),
+            _normalize_tags(args.tags),
+            thumbnail_file=args.thumbnail,
             privacy_status=args.privacy
         )
         
         if video_id:
             print(f"Upload successful! Video ID: {video_id}")
             print(f"Video URL: https://youtu.be/{video_id}")
-            
-            if args.thumbnail:
-                print(f"Setting thumbnail {args.thumbnail}...")
-                if uploader.update_thumbnail(video_id, args.thumbnail):
-                    print("Thumbnail set successfully!")
-                else:
-                    print("Failed to set thumbnail.")
         else:
             print("Upload failed.")
     